@@ -0,0 +1,16 @@
+"""
+회의 문서 조회에 공통으로 사용하는 필드 정의
+(무거운 의존성 없이 분석기와 파싱 모듈 양쪽에서 import할 수 있도록 분리)
+"""
+
+
+# 분석에 필요한 필드 (standard 스키마 + Google Drive 스키마 정규화에 필요한 필드)
+MEETING_ANALYSIS_PROJECTION = {
+    'title': 1,
+    'name': 1,
+    'date': 1,
+    'createdTime': 1,
+    'participants': 1,
+    'transcript': 1,
+    'content': 1
+}
@@ -8,11 +8,78 @@ import re
 from datetime import datetime
 from pymongo import MongoClient
 import google.generativeai as genai
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Optional, Union, Iterator
 from collections import defaultdict
 from prompt_templates import PromptTemplates, PromptConfig, get_template_version
+from meeting_fields import MEETING_ANALYSIS_PROJECTION
 
 
+# 참여자 이름 매핑 (별칭/변형 → 표준 이름, _normalize_participant_name)
+PARTICIPANT_NAME_MAPPING = {
+    # Nam 관련 변형들
+    "Nam": "Nam Pham",
+    "Nam Phạm Tiến": "Nam Pham",
+    "Nam Tiến": "Nam Pham",
+
+    # Chiko Nakamura 관련 변형들
+    "Nakamura Chiko": "Chiko Nakamura",
+
+    # Thomas Shin 관련 변형들
+    "Geonwoo Shin": "Thomas Shin",
+
+    # 대괄호와 그 안의 내용 제거 (예: "이낙준[ 정보보호대학원박사과정수료연구(재학) / 정보보호학과 ]" → "이낙준")는
+    # _normalize_participant_name에서 정규식으로 처리
+}
+
+# parse_transcript 정규식 (줄마다 호출되므로 모듈 로드 시 한 번만 컴파일)
+# 형식 1, 2: 한 줄에 타임스탬프와 발언자가 모두 있는 경우
+_SINGLE_LINE_PATTERNS = (
+    re.compile(r'\[(\d{2}:\d{2}:\d{2})\]\s*([^:]+):\s*(.+)'),  # [00:01:23] 김민수: 내용
+    re.compile(r'\[(\d{2}:\d{2})\]\s*([^:]+):\s*(.+)'),        # [01:23] 김민수: 내용
+    re.compile(r'^(\d{2}:\d{2}:\d{2})\s+([^:]+):\s*(.+)'),     # 00:01:23 김민수: 내용
+    re.compile(r'^(\d{2}:\d{2})\s+([^:]+):\s*(.+)'),           # 01:23 김민수: 내용
+)
+# 형식 3: 타임스탬프만 있는 줄
+_TIMESTAMP_LINE_RE = re.compile(r'^(\d{2}:\d{2}:\d{2})$|^(\d{2}:\d{2})$')
+# 발언자: 내용
+_SPEAKER_LINE_RE = re.compile(r'^([^:]+):\s*(.+)')
+_SPEAKER_PREFIX_RE = re.compile(r'^[^:]+:\s*')
+# 발언자 자리에 타임스탬프가 온 경우
+_TIMESTAMP_ONLY_RE = re.compile(r'^\d{2}:\d{2}(:\d{2})?$')
+
+# 참여자가 아닌 발언자 패턴 (_is_valid_participant, 하나의 정규식으로 결합)
+_INVALID_PARTICIPANT_PATTERNS = [
+    r'^Transcription\s+ended',
+    r'^Transcription\s+ended\s+after',
+    r'^Session\s+ended',
+    r'^Session\s+ended\s+after',
+    r'Meeting\s+ended\s+after',  # "Meeting ended after 00", "Meeting ended after 01" 등
+    r'^This\s+editable\s+transcript',
+    r'^You\s+should\s+review',
+    r'^Please\s+provide\s+feedback',
+    r'^Get\s+tips',
+    r'^\*',  # "* "로 시작하는 것 (요약 항목)
+    r'^Ooo',  # "Ooo"로 시작하는 것 (파일명 등)
+    r'^첨부파일',  # "첨부파일"로 시작하는 것
+    r'^초대됨',  # "초대됨"으로 시작하는 것
+    r'^Gemini가',  # "Gemini가"로 시작하는 것
+    r'^수정 가능한',  # "수정 가능한"으로 시작하는 것
+    r'^\d{4}년',  # "2025년" 같은 날짜 형식
+    r'^\d{2}:\d{2}:\d{2}$',  # 타임스탬프만 있는 것 (정확히 일치)
+    r'^\d{2}:\d{2}$',  # 타임스탬프만 있는 것 (정확히 일치)
+    r'^후 스크립트',  # "후 스크립트"로 시작하는 것
+    r'^\d+$',  # 숫자만 있는 것 (예: "00")
+    r'^Attachments',  # "Attachments Project TRH" 등
+    r'^Project\s+TRH$',  # "Project TRH" (정확히 일치)
+    r'\'s\s+Presentation$',  # "Jake Jang's Presentation" 등
+    r'님의\s+발표$',  # "Theo Lee님의 발표" 등
+    r'^[\ufeff]',  # BOM 문자로 시작하는 것
+]
+_INVALID_PARTICIPANT_RE = re.compile(
+    '|'.join(f'(?:{pattern})' for pattern in _INVALID_PARTICIPANT_PATTERNS),
+    re.IGNORECASE
+)
+
 
 class MeetingPerformanceAnalyzer:
     def __init__(self, 
@@ -254,38 +321,9 @@ class MeetingPerformanceAnalyzer:
         if not speaker:
             return False
         
-        # 필터링할 패턴들
-        invalid_patterns = [
-            r'^Transcription\s+ended',
-            r'^Transcription\s+ended\s+after',
-            r'^Session\s+ended',
-            r'^Session\s+ended\s+after',
-            r'Meeting\s+ended\s+after',  # "Meeting ended after 00", "Meeting ended after 01" 등
-            r'^This\s+editable\s+transcript',
-            r'^You\s+should\s+review',
-            r'^Please\s+provide\s+feedback',
-            r'^Get\s+tips',
-            r'^\*',  # "* "로 시작하는 것 (요약 항목)
-            r'^Ooo',  # "Ooo"로 시작하는 것 (파일명 등)
-            r'^첨부파일',  # "첨부파일"로 시작하는 것
-            r'^초대됨',  # "초대됨"으로 시작하는 것
-            r'^Gemini가',  # "Gemini가"로 시작하는 것
-            r'^수정 가능한',  # "수정 가능한"으로 시작하는 것
-            r'^\d{4}년',  # "2025년" 같은 날짜 형식
-            r'^\d{2}:\d{2}:\d{2}$',  # 타임스탬프만 있는 것 (정확히 일치)
-            r'^\d{2}:\d{2}$',  # 타임스탬프만 있는 것 (정확히 일치)
-            r'^후 스크립트',  # "후 스크립트"로 시작하는 것
-            r'^\d+$',  # 숫자만 있는 것 (예: "00")
-            r'^Attachments',  # "Attachments Project TRH" 등
-            r'^Project\s+TRH$',  # "Project TRH" (정확히 일치)
-            r'\'s\s+Presentation$',  # "Jake Jang's Presentation" 등
-            r'님의\s+발표$',  # "Theo Lee님의 발표" 등
-            r'^[﻿\ufeff]',  # BOM 문자로 시작하는 것
-        ]
-        
-        for pattern in invalid_patterns:
-            if re.search(pattern, speaker, re.IGNORECASE):
-                return False
+        # 필터링할 패턴 (모듈 상단에서 하나로 결합해 컴파일해 둠)
+        if _INVALID_PARTICIPANT_RE.search(speaker):
+            return False
         
         return True
     
@@ -304,23 +342,7 @@ class MeetingPerformanceAnalyzer:
         
         name = name.strip()
         
-        # 이름 매핑 딕셔너리 (별칭/변형 → 표준 이름)
-        name_mapping = {
-            # Nam 관련 변형들
-            "Nam": "Nam Pham",
-            "Nam Phạm Tiến": "Nam Pham",
-            "Nam Tiến": "Nam Pham",
-            
-            # Chiko Nakamura 관련 변형들
-            "Nakamura Chiko": "Chiko Nakamura",
-
-            # Thomas Shin 관련 변형들
-            "Geonwoo Shin": "Thomas Shin",
-            
-            # 기타 일반적인 정규화
-            # 대괄호와 그 안의 내용 제거 (예: "이낙준[ 정보보호대학원박사과정수료연구(재학) / 정보보호학과 ]" → "이낙준")
-            # 하지만 이건 정규식으로 처리하는 게 나을 수도 있음
-        }
+        name_mapping = PARTICIPANT_NAME_MAPPING
         
         # 매핑에 있으면 표준 이름으로 변환
         if name in name_mapping:
@@ -690,7 +712,8 @@ class MeetingPerformanceAnalyzer:
         
         return sorted(list(participants))
         
-    def fetch_meeting_records(self, filters: Dict[str, Any] = None, limit: int = 0, sort: List[tuple] = None) -> List[Dict]:
+    def fetch_meeting_records(self, filters: Dict[str, Any] = None, limit: int = 0, sort: List[tuple] = None,
+                              batch_size: int = 0, projection: Dict[str, Any] = None) -> List[Dict]:
         """
         MongoDB에서 회의 transcript 데이터 가져오기
         Google Drive 스키마 형식도 자동으로 처리
@@ -700,6 +723,10 @@ class MeetingPerformanceAnalyzer:
                      'date' 필터는 자동으로 'createdTime' 필드에도 적용됨
             limit: 가져올 문서 최대 개수 (0이면 제한 없음)
             sort: 정렬 기준 (예: [('date', -1)])
+            batch_size: 서버에서 한 번에 받아올 문서 수 (0이면 드라이버 기본값)
+                        transcript가 큰 컬렉션에서는 작게 지정해 메모리 사용량을 줄임
+            projection: 가져올 필드 (None이면 전체 필드)
+                        Google Drive 스키마 정규화를 위해 name/createdTime/content도 포함해야 함
             
         Returns:
             회의 transcript 문서 리스트 (정규화됨)
@@ -770,13 +797,16 @@ class MeetingPerformanceAnalyzer:
                 else:
                     mongo_filters = date_or_filter
         
-        cursor = self.collection.find(mongo_filters)
+        cursor = self.collection.find(mongo_filters, projection)
         
         if sort:
             cursor = cursor.sort(sort)
             
         if limit > 0:
             cursor = cursor.limit(limit)
+        
+        if batch_size > 0:
+            cursor = cursor.batch_size(batch_size)
             
         meetings = list(cursor)
         
@@ -834,6 +864,49 @@ class MeetingPerformanceAnalyzer:
         print(f"📚 {len(normalized_meetings)}개의 회의 transcript를 가져왔습니다.")
         return normalized_meetings
     
+    def fetch_meetings_by_ids(self, meeting_ids: List[Any], projection: Dict[str, Any] = None) -> List[Dict]:
+        """
+        _id 목록에 해당하는 회의만 MongoDB에서 가져오기
+        Google Drive 스키마 형식도 자동으로 처리
+        
+        Args:
+            meeting_ids: 회의 _id 리스트 (저장된 _id와 같은 타입, 보통 ObjectId)
+            projection: 가져올 필드 (None이면 MEETING_ANALYSIS_PROJECTION)
+            
+        Returns:
+            회의 transcript 문서 리스트 (정규화됨)
+        """
+        if projection is None:
+            projection = MEETING_ANALYSIS_PROJECTION
+        
+        # _id 인덱스로 대상 문서만 조회하고 분석에 필요한 필드만 전송
+        cursor = self.collection.find({'_id': {'$in': list(meeting_ids)}}, projection)
+        return [self._normalize_document(meeting) for meeting in cursor]
+    
+    def iter_meeting_records(self, filters: Dict[str, Any] = None, projection: Dict[str, Any] = None,
+                             batch_size: int = 500) -> Iterator[Dict]:
+        """
+        회의 문서를 커서로 하나씩 가져오기 (전체 결과를 리스트로 만들지 않음)
+        
+        컬렉션 전체를 훑는 작업에서 메모리 사용량이 문서 수에 비례해 늘지 않도록 함.
+        fetch_meeting_records와 달리 date 필터를 createdTime으로 확장하지 않으므로
+        filters는 MongoDB 쿼리 그대로 전달해야 함.
+        
+        Args:
+            filters: MongoDB 쿼리 필터 (None이면 전체)
+            projection: 가져올 필드 (None이면 전체 필드)
+            batch_size: 서버에서 한 번에 받아올 문서 수
+            
+        Yields:
+            정규화된 회의 문서
+        """
+        # 오래 걸리는 순회 중 서버가 유휴 커서를 정리하지 않도록 하고,
+        # 순회가 중간에 끝나도 with 블록에서 서버 커서를 닫음
+        cursor = self.collection.find(filters or {}, projection, no_cursor_timeout=True).batch_size(batch_size)
+        with cursor:
+            for doc in cursor:
+                yield self._normalize_document(doc)
+    
     def parse_transcript(self, transcript: str) -> List[Dict[str, str]]:
         """
         Transcript를 파싱하여 구조화된 데이터로 변환
@@ -863,16 +936,9 @@ class MeetingPerformanceAnalyzer:
                 continue
                 
             # 형식 1, 2: 한 줄에 타임스탬프와 발언자가 모두 있는 경우
-            patterns_single_line = [
-                r'\[(\d{2}:\d{2}:\d{2})\]\s*([^:]+):\s*(.+)',  # [00:01:23] 김민수: 내용
-                r'\[(\d{2}:\d{2})\]\s*([^:]+):\s*(.+)',        # [01:23] 김민수: 내용
-                r'^(\d{2}:\d{2}:\d{2})\s+([^:]+):\s*(.+)',     # 00:01:23 김민수: 내용
-                r'^(\d{2}:\d{2})\s+([^:]+):\s*(.+)',           # 01:23 김민수: 내용
-            ]
-            
             matched = False
-            for pattern in patterns_single_line:
-                match = re.match(pattern, line)
+            for pattern in _SINGLE_LINE_PATTERNS:
+                match = pattern.match(line)
                 if match:
                     timestamp, speaker, text = match.groups()
                     speaker = speaker.strip()
@@ -894,8 +960,7 @@ class MeetingPerformanceAnalyzer:
             
             # 형식 3: 타임스탬프가 별도 줄에 있는 경우
             # 예: 00:00:00\n \nJeff Chung: Hello Jamie.
-            timestamp_pattern = r'^(\d{2}:\d{2}:\d{2})$|^(\d{2}:\d{2})$'
-            timestamp_match = re.match(timestamp_pattern, line)
+            timestamp_match = _TIMESTAMP_LINE_RE.match(line)
             
             if timestamp_match:
                 timestamp = timestamp_match.group(1) or timestamp_match.group(2)
@@ -908,7 +973,7 @@ class MeetingPerformanceAnalyzer:
                 if i < len(lines):
                     speaker_line = lines[i].strip()
                     # 발언자: 내용 형식
-                    speaker_match = re.match(r'^([^:]+):\s*(.+)', speaker_line)
+                    speaker_match = _SPEAKER_LINE_RE.match(speaker_line)
                     if speaker_match:
                         speaker = speaker_match.group(1).strip()
                         text = speaker_match.group(2).strip()
@@ -926,7 +991,7 @@ class MeetingPerformanceAnalyzer:
                         while i < len(lines):
                             next_line = lines[i].strip()
                             # 타임스탬프나 새로운 발언자가 나오면 중단
-                            if re.match(timestamp_pattern, next_line) or re.match(r'^[^:]+:\s*', next_line):
+                            if _TIMESTAMP_LINE_RE.match(next_line) or _SPEAKER_PREFIX_RE.match(next_line):
                                 break
                             # 빈 줄이면 중단
                             if not next_line:
@@ -943,13 +1008,13 @@ class MeetingPerformanceAnalyzer:
                         continue
             
             # 형식 4: 발언자: 내용만 있는 경우 (타임스탬프 없음)
-            speaker_only_match = re.match(r'^([^:]+):\s*(.+)', line)
+            speaker_only_match = _SPEAKER_LINE_RE.match(line)
             if speaker_only_match:
                 speaker = speaker_only_match.group(1).strip()
                 text = speaker_only_match.group(2).strip()
                 
                 # 타임스탬프 패턴인지 먼저 확인 (예: "00:00:00", "00:01:23")
-                if re.match(r'^\d{2}:\d{2}(:\d{2})?$', speaker):
+                if _TIMESTAMP_ONLY_RE.match(speaker):
                     i += 1
                     continue
                 
@@ -978,6 +1043,19 @@ class MeetingPerformanceAnalyzer:
         
         return parsed_lines
     
+    def parse_transcripts_bulk(self, transcripts: List[str]) -> List[List[Dict[str, str]]]:
+        """
+        여러 transcript를 한 번에 파싱 (컴파일된 정규식을 모든 transcript에 재사용)
+        
+        Args:
+            transcripts: 원본 transcript 텍스트 리스트
+            
+        Returns:
+            transcripts와 같은 순서의 파싱 결과 리스트
+        """
+        parse = self.parse_transcript
+        return [parse(transcript) if transcript else [] for transcript in transcripts]
+    
     def _timestamp_to_seconds(self, timestamp: str) -> int:
         """
         타임스탬프 문자열을 초로 변환
@@ -1187,7 +1265,8 @@ class MeetingPerformanceAnalyzer:
     def analyze_participant_performance(self, formatted_text: str, stats: Dict, 
                                        template_override: str = None,
                                        custom_instructions: str = "",
-                                       version: str = None) -> Dict[str, Any]:
+                                       version: str = None,
+                                       verbose: bool = True) -> Dict[str, Any]:
         """
         Gemini API를 사용하여 참여자들의 성과 분석
         
@@ -1197,6 +1276,7 @@ class MeetingPerformanceAnalyzer:
             template_override: 이번 분석에만 사용할 템플릿 (선택)
             custom_instructions: 추가 지시사항 (선택)
             version: 사용할 템플릿 버전 (None이면 최신 버전)
+            verbose: False이면 진행/오류 메시지를 출력하지 않음 (여러 스레드에서 동시에 호출할 때)
             
         Returns:
             분석 결과 딕셔너리
@@ -1232,12 +1312,13 @@ class MeetingPerformanceAnalyzer:
         
         try:
             # 사용 중인 모델, 템플릿, 버전 정보 출력
-            print("🤖 Gemini API로 성과 분석 중...")
-            print(f"   모델: {self.model_name}")
-            print(f"   템플릿: {template_name}")
-            print(f"   버전: {template_version if template_version else 'latest'}")
-            if template_override:
-                print(f"   (템플릿 오버라이드: {template_override})")
+            if verbose:
+                print("🤖 Gemini API로 성과 분석 중...")
+                print(f"   모델: {self.model_name}")
+                print(f"   템플릿: {template_name}")
+                print(f"   버전: {template_version if template_version else 'latest'}")
+                if template_override:
+                    print(f"   (템플릿 오버라이드: {template_override})")
             response = self.model.generate_content(prompt)
             
             # 응답 텍스트 추출
@@ -1256,7 +1337,8 @@ class MeetingPerformanceAnalyzer:
             return result
             
         except Exception as e:
-            print(f"❌ 분석 중 오류 발생: {str(e)}")
+            if verbose:
+                print(f"❌ 분석 중 오류 발생: {str(e)}")
             
             return {
                 "status": "error",
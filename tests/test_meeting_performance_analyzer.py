@@ -0,0 +1,63 @@
+"""
+meeting_performance_analyzer.py 발언자 검증 테스트
+"""
+
+import re
+import sys
+import os
+
+# 상위 디렉토리를 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from meeting_performance_analyzer import (
+    MeetingPerformanceAnalyzer,
+    _INVALID_PARTICIPANT_PATTERNS,
+    _INVALID_PARTICIPANT_RE,
+)
+
+
+# (발언자 이름, 유효한 참여자 여부)
+REPRESENTATIVE_NAMES = [
+    ("김민수", True),
+    ("Nam Pham", True),
+    ("Jake Jang", True),
+    ("이낙준[ 정보보호학과 ]", True),
+    ("Project TRH Lead", True),
+    ("Ooops", False),
+    ("Transcription ended after 01:02:03", False),
+    ("transcription ENDED", False),
+    ("Session ended after 00", False),
+    ("The Meeting ended after 01", False),
+    ("This editable transcript was created", False),
+    ("You should review Gemini's notes", False),
+    ("Please provide feedback", False),
+    ("Get tips", False),
+    ("* 요약 항목", False),
+    ("첨부파일 회의록", False),
+    ("초대됨 Alice", False),
+    ("Gemini가 만든 메모", False),
+    ("수정 가능한 스크립트", False),
+    ("2025년 1월 3일", False),
+    ("00:01:23", False),
+    ("01:23", False),
+    ("후 스크립트", False),
+    ("00", False),
+    ("Attachments Project TRH", False),
+    ("Project TRH", False),
+    ("Jake Jang's Presentation", False),
+    ("Theo Lee님의 발표", False),
+]
+
+
+def test_combined_regex_matches_per_pattern_checks():
+    """결합한 _INVALID_PARTICIPANT_RE가 패턴별 re.search 검사와 같은 결과를 내는지 테스트"""
+    for name, _ in REPRESENTATIVE_NAMES + [("\ufeffBob", False)]:
+        per_pattern = any(re.search(pattern, name, re.IGNORECASE) for pattern in _INVALID_PARTICIPANT_PATTERNS)
+        assert bool(_INVALID_PARTICIPANT_RE.search(name)) == per_pattern, name
+
+
+def test_is_valid_participant():
+    """대표적인 이름에 대한 _is_valid_participant의 수락/거부 결과 테스트"""
+    analyzer = object.__new__(MeetingPerformanceAnalyzer)
+    for name, expected in REPRESENTATIVE_NAMES:
+        assert analyzer._is_valid_participant(name) == expected, name
@@ -0,0 +1,150 @@
+"""
+utils/transcript_parser.py 헬퍼 테스트
+"""
+
+import re
+import sys
+import os
+import json
+from datetime import datetime, timezone
+from unittest.mock import Mock, patch
+
+from bson import ObjectId
+
+# 상위 디렉토리를 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.transcript_parser import (
+    _participant_filter, _apply_participant_filter, _analyze_with_retry, _save_original_meetings,
+    _fetch_meeting_page
+)
+from utils.transcript_parser_core import convert_objectid
+
+
+def _speaker_regex(condition):
+    """_participant_filter 결과에서 transcript 정규식을 꺼내 Python re로 컴파일 (MongoDB $options 'm'과 동일)"""
+    clause = next(c for c in condition['$or'] if 'transcript' in c)
+    return re.compile(clause['transcript']['$regex'], re.MULTILINE)
+
+
+def test_participant_filter_expands_aliases():
+    """정규화된 이름이 원본 별칭까지 확장되는지 테스트"""
+    condition = _participant_filter(['Nam Pham'])
+    aliases = next(c for c in condition['$or'] if '$in' in c.get('participants', {}))['participants']['$in']
+    assert set(aliases) == {'Nam Pham', 'Nam', 'Nam Phạm Tiến', 'Nam Tiến'}
+
+    speaker_re = _speaker_regex(condition)
+    assert speaker_re.search("[00:01:23] Nam: 안녕하세요")
+    assert speaker_re.search("00:01 Nam Tiến: hi")
+    assert speaker_re.search("intro\nNam  Pham : hi")
+
+
+def test_participant_filter_bracket_suffix():
+    """'이름[ 소속 ]' 형태의 원본 표기도 매칭되는지 테스트"""
+    condition = _participant_filter(['이낙준'])
+    speaker_re = _speaker_regex(condition)
+    assert speaker_re.search("[00:00:05] 이낙준[ 정보보호학과 ]: 시작하겠습니다")
+
+    participants_re = re.compile(
+        next(c for c in condition['$or'] if '$regex' in c.get('participants', {}))['participants']['$regex']
+    )
+    assert participants_re.search("이낙준[ 정보보호대학원박사과정수료연구(재학) / 정보보호학과 ]")
+    assert not participants_re.search("이낙준이")
+
+
+def test_participant_filter_is_anchored():
+    """발언 패턴이 줄 시작(또는 타임스탬프 뒤)에만 매칭되는지 테스트"""
+    speaker_re = _speaker_regex(_participant_filter(['Kim']))
+    assert speaker_re.search("[00:01:23] Kim: 네")
+    assert not speaker_re.search("[00:01:23] Sam Kim: 네")
+    assert not speaker_re.search("I told Kim: later")
+
+
+def test_apply_participant_filter_sets_post_filter():
+    """정확한 일치 조건이 post_filters에 리스트로 저장되는지 테스트"""
+    post_filters = {}
+    filters = _apply_participant_filter({'date': {'$gte': 1}}, post_filters, ['Alice', 'Bob', 'Alice'])
+    assert post_filters['participants'] == ['Alice', 'Bob']
+    assert '$and' in filters and len(filters['$and']) == 2
+
+
+def test_analyze_with_retry_backs_off_on_rate_limit():
+    """요청 한도 초과(429)만 재시도하고 워커 호출은 조용히 실행되는지 테스트"""
+    analyzer = Mock()
+    analyzer.analyze_participant_performance.side_effect = [
+        {'status': 'error', 'error': '429 Resource has been exhausted (e.g. check quota).'},
+        {'status': 'success', 'analysis': 'ok'},
+    ]
+    with patch('utils.transcript_parser.time.sleep') as mock_sleep:
+        result = _analyze_with_retry(analyzer, 'text', {}, version=None)
+    assert result['status'] == 'success'
+    assert mock_sleep.call_count == 1
+    assert all(call.kwargs['verbose'] is False for call in analyzer.analyze_participant_performance.call_args_list)
+
+    # 한도 초과가 아닌 오류는 바로 반환
+    analyzer = Mock()
+    analyzer.analyze_participant_performance.return_value = {'status': 'error', 'error': 'invalid prompt'}
+    with patch('utils.transcript_parser.time.sleep') as mock_sleep:
+        result = _analyze_with_retry(analyzer, 'text', {})
+    assert result['status'] == 'error'
+    assert analyzer.analyze_participant_performance.call_count == 1
+    mock_sleep.assert_not_called()
+
+
+def test_save_original_meetings_matches_convert_objectid(tmp_path):
+    """원본 회의 저장 결과가 기존 convert_objectid 변환 결과와 같은지 테스트"""
+    doc = {
+        '_id': ObjectId('691cee06d10432b7f9472790'),
+        'title': '주간 회의',
+        'date': datetime(2025, 11, 17, 10, 17, 47, tzinfo=timezone.utc),
+        'participants': ['Alice', 'Bob'],
+        'extra': {'ref': ObjectId('691cee06d10432b7f94727a8'), 'seen': [datetime(2024, 1, 1, 9, 30)]}
+    }
+    analyzer = Mock()
+    analyzer.iter_meeting_records.side_effect = lambda filters, *args, **kwargs: [
+        d for d in [doc] if d['_id'] in filters['_id']['$in']
+    ]
+    projected = {'_id': doc['_id'], 'title': doc['title']}
+
+    _save_original_meetings({'meetings': [projected]}, output_dir=str(tmp_path), analyzer=analyzer)
+
+    (output_file,) = tmp_path.glob('original_meetings_*.json')
+    saved = json.loads(output_file.read_text(encoding='utf-8'))
+    assert saved['original_meetings'] == [convert_objectid(doc)]
+
+
+def test_fetch_meeting_page_sorts_on_coalesced_date():
+    """회의 목록이 date/createdTime을 합친 키로 정렬되고 그 순서대로 반환되는지 테스트"""
+    drive_doc = {'_id': 1, 'name': 'Drive 회의', 'createdTime': datetime(2025, 3, 1)}
+    standard_doc = {'_id': 2, 'title': '일반 회의', 'date': datetime(2025, 1, 1)}
+    analyzer = Mock()
+    # 서버 정렬 결과: createdTime만 있는 최신 문서가 먼저
+    analyzer.collection.aggregate.return_value = [{'_id': 1}, {'_id': 2}]
+    analyzer.collection.find.return_value = [standard_doc, drive_doc]
+
+    page = _fetch_meeting_page(analyzer, 1, 2)
+
+    assert page == [drive_doc, standard_doc]
+    pipeline = analyzer.collection.aggregate.call_args.args[0]
+    assert pipeline[0] == {'$project': {'_sort_date': {'$ifNull': ['$date', '$createdTime']}}}
+    assert pipeline[1] == {'$sort': {'_sort_date': -1, '_id': 1}}
+    assert pipeline[2:] == [{'$skip': 2}, {'$limit': 2}]
+    assert analyzer.collection.find.call_args.args[0] == {'_id': {'$in': [1, 2]}}
+
+
+def test_save_original_meetings_fetches_in_chunks(tmp_path):
+    """원본 회의를 다시 조회할 때 _id를 나눠서 조회하고 원래 순서를 유지하는지 테스트"""
+    docs = [{'_id': i, 'title': f'회의 {i}', 'transcript': 'x'} for i in range(5)]
+    analyzer = Mock()
+    analyzer.iter_meeting_records.side_effect = lambda filters, *args, **kwargs: [
+        d for d in reversed(docs) if d['_id'] in filters['_id']['$in']
+    ]
+
+    with patch('utils.transcript_parser.ORIGINAL_FETCH_CHUNK', 2):
+        _save_original_meetings({'meetings': [{'_id': d['_id']} for d in docs]}, output_dir=str(tmp_path), analyzer=analyzer)
+
+    chunks = [call.args[0]['_id']['$in'] for call in analyzer.iter_meeting_records.call_args_list]
+    assert chunks == [[0, 1], [2, 3], [4]]
+    (output_file,) = tmp_path.glob('original_meetings_*.json')
+    saved = json.loads(output_file.read_text(encoding='utf-8'))
+    assert saved['original_meetings'] == docs
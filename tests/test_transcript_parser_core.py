@@ -0,0 +1,218 @@
+"""
+utils/transcript_parser_core.py 핵심 기능 테스트
+"""
+
+import sys
+import os
+import json
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+from bson import ObjectId
+
+# 상위 디렉토리를 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import utils.transcript_parser_core as core
+from meeting_performance_analyzer import MeetingPerformanceAnalyzer
+
+
+class _FailingAnalyzer(MeetingPerformanceAnalyzer):
+    """'BOOM'이 들어 있는 transcript에서 예외를 내는 분석기 (프로세스 풀에서 피클링되도록 모듈 수준에 정의)"""
+
+    def parse_transcript(self, transcript):
+        if 'BOOM' in transcript:
+            raise ValueError('parse failed')
+        return super().parse_transcript(transcript)
+
+    def parse_transcripts_bulk(self, transcripts):
+        return [self.parse_transcript(transcript) for transcript in transcripts]
+
+
+def _analyzer(cls=MeetingPerformanceAnalyzer):
+    """DB/Gemini 연결 없이 파싱 메서드만 쓰는 분석기 인스턴스"""
+    return object.__new__(cls)
+
+
+def _items(count, prefix='m'):
+    """(회의 ID, transcript) 테스트 항목 생성"""
+    return [
+        (f'{prefix}{i}', f'[00:00:0{i % 10}] Alice: hello {i}\n[00:00:1{i % 10}] Bob: hi {i}')
+        for i in range(count)
+    ]
+
+
+def setup_function():
+    core.clear_parse_cache()
+
+
+def test_parse_and_stats_many_pool_path():
+    """항목이 많으면 spawn 프로세스 풀로 파싱하고 입력 순서대로 반환하는지 테스트"""
+    items = _items(core.PARSE_POOL_MIN_ITEMS + 2)
+    with patch.object(core, 'ProcessPoolExecutor', wraps=core.ProcessPoolExecutor) as pool_cls:
+        results = core.parse_and_stats_many(_analyzer(), items)
+
+    assert pool_cls.call_args.kwargs['mp_context'].get_start_method() == 'spawn'
+    assert len(results) == len(items)
+    for (_, transcript), (parsed_transcript, stats) in zip(items, results):
+        assert parsed_transcript[0]['text'] == transcript.split('\n')[0].split(': ', 1)[1]
+        assert set(stats) == {'Alice', 'Bob'}
+    assert not core._PARSE_CACHE  # 일괄 파싱은 캐시를 거치지 않음
+
+
+def test_parse_and_stats_many_sequential_fallback():
+    """항목이 적거나 프로세스 풀을 만들 수 없으면 현재 프로세스에서 파싱하는지 테스트"""
+    analyzer = _analyzer()
+    with patch.object(core, 'ProcessPoolExecutor') as mock_pool:
+        results = core.parse_and_stats_many(analyzer, _items(core.PARSE_POOL_MIN_ITEMS - 1))
+    mock_pool.assert_not_called()
+    assert all(set(stats) == {'Alice', 'Bob'} for _, stats in results)
+
+    core.clear_parse_cache()
+    with patch.object(core, 'ProcessPoolExecutor', side_effect=OSError('no processes')):
+        results = core.parse_and_stats_many(analyzer, _items(core.PARSE_POOL_MIN_ITEMS + 1))
+    assert len(results) == core.PARSE_POOL_MIN_ITEMS + 1
+    assert all(set(stats) == {'Alice', 'Bob'} for _, stats in results)
+
+
+def test_parse_and_stats_many_returns_worker_exceptions():
+    """파싱 중 예외는 해당 항목 자리에 예외 객체로 반환되는지 테스트"""
+    items = _items(core.PARSE_POOL_MIN_ITEMS + 1)
+    items[2] = ('bad', 'BOOM')
+
+    # 프로세스 풀 경로
+    results = core.parse_and_stats_many(_analyzer(_FailingAnalyzer), items)
+    assert isinstance(results[2], ValueError)
+    assert all(not isinstance(r, Exception) for i, r in enumerate(results) if i != 2)
+
+    # 순차 경로 (일괄 파싱이 실패하면 항목별로 다시 파싱)
+    core.clear_parse_cache()
+    results = core.parse_and_stats_many(_analyzer(_FailingAnalyzer), items[:3])
+    assert isinstance(results[2], ValueError)
+    assert set(results[0][1]) == {'Alice', 'Bob'}
+
+
+def test_parse_cache_put_evicts_least_recently_used():
+    """_parse_cache_put이 최대 크기를 넘으면 가장 오래 사용되지 않은 항목을 제거하는지 테스트"""
+    with patch.object(core, '_PARSE_CACHE_MAXSIZE', 2):
+        core._parse_cache_put('a', 1)
+        core._parse_cache_put('b', 2)
+        core._parse_cache_put('a', 1)  # 'a'를 최근 사용으로 갱신
+        core._parse_cache_put('c', 3)
+        assert list(core._PARSE_CACHE) == ['a', 'c']
+
+
+def test_with_length_prefilter_handles_none_and_merges():
+    """post_filters가 None이어도 동작하고, 기존 $and/$expr 조건과 결합되는지 테스트"""
+    filters = {'$and': [{'date': {'$gte': 1}}, {'title': 'x'}]}
+    assert core._with_length_prefilter(filters, None) is filters
+    assert core._with_length_prefilter(None, None) is None
+    assert core._with_length_prefilter(filters, {}) is filters
+
+    query = core._with_length_prefilter(filters, {'min_transcript_length': 10, 'max_transcript_length': 100})
+    assert query['$and'] == filters['$and']
+    assert '$expr' not in filters  # 원본 필터는 변경하지 않음
+    min_cond, max_cond = query['$expr']['$and']
+    assert min_cond['$gte'][1] == 10
+    assert min_cond['$gte'][0] == {'$max': [core._str_len_expr('$transcript'), core._str_len_expr('$content')]}
+    assert max_cond == {'$lte': [core._str_len_expr('$transcript'), 100]}
+
+    existing = {'$expr': {'$eq': ['$a', 1]}}
+    query = core._with_length_prefilter(existing, {'max_transcript_length': 5})
+    assert query['$expr']['$and'][0] == {'$eq': ['$a', 1]}
+    assert query['$expr']['$and'][1]['$lte'][1] == 5
+
+
+# (transcript, 기대하는 실패 이유) - 앞선 조건이 우선하므로 여러 표시가 겹치는 경우도 포함
+CLASSIFY_FAILURE_CASES = [
+    ("Transcription ended after 00:00:12", "Transcription ended 메시지만 있음 (실제 내용 없음)"),
+    ("TRANSCRIPTION ENDED AFTER 01:02", "Transcription ended 메시지만 있음 (실제 내용 없음)"),
+    # ended 메시지가 후 스크립트 메시지보다 우선
+    ("후 스크립트 작성이 종료되었습니다\nTranscription ended after 00:01",
+     "Transcription ended 메시지만 있음 (실제 내용 없음)"),
+    ("후 스크립트 작성이 종료되었습니다", "후 스크립트 작성 종료 메시지만 있음 (실제 내용 없음)"),
+    # 후 스크립트 메시지가 길이 조건보다 우선 (길고 구분자가 없어도)
+    ("후 스크립트 작성이 종료되었습니다 " + "가" * 300, "후 스크립트 작성 종료 메시지만 있음 (실제 내용 없음)"),
+    ("짧은 메모", "Transcript가 너무 짧음 (5자)"),
+    # 짧으면 구분자가 없어도 길이 이유가 우선
+    ("   abc   ", "Transcript가 너무 짧음 (9자)"),
+    ("가" * 250, "타임스탬프/발언자 구분자 없음"),
+    ("가" * 250 + ":", "발언이 추출되지 않았습니다"),
+    ("[" + "가" * 250, "발언이 추출되지 않았습니다"),
+]
+
+
+def test_classify_failure():
+    """_classify_failure의 분류 결과와 겹치는 표시 사이의 우선순위 테스트"""
+    for transcript, expected in CLASSIFY_FAILURE_CASES:
+        assert core._classify_failure(transcript) == expected, transcript[:40]
+
+
+def test_write_json_formats_datetime_as_iso(tmp_path):
+    """orjson 사용 여부와 관계없이 datetime이 ISO 8601 문자열로 저장되는지 테스트"""
+    data = {
+        'date': datetime(2025, 11, 17, 10, 17, 47, tzinfo=timezone.utc),
+        'naive': datetime(2024, 1, 1, 10, 0, 0),
+        'id': ObjectId('691cee06d10432b7f9472790')
+    }
+    expected = {
+        'date': '2025-11-17T10:17:47+00:00',
+        'naive': '2024-01-01T10:00:00',
+        'id': '691cee06d10432b7f9472790'
+    }
+
+    output_file = tmp_path / 'out.json'
+    core.write_json(str(output_file), data)
+    assert json.loads(output_file.read_text(encoding='utf-8')) == expected
+
+    with patch.object(core, 'orjson', None):
+        core.write_json(str(output_file), data)
+    assert json.loads(output_file.read_text(encoding='utf-8')) == expected
+
+
+class _FakeParticipantsCollection:
+    """get_all_participants가 쓰는 두 aggregate만 흉내 내는 컬렉션 ('participants.0' $exists 의미를 따름)"""
+
+    def __init__(self, docs):
+        self.docs = docs
+        self.pipelines = []
+
+    def with_options(self, **kwargs):
+        return self
+
+    @staticmethod
+    def _has_first_element(doc):
+        # 'participants.0'은 비어 있지 않은 배열에서만 존재 (문자열 등은 경로를 따라가지 않음)
+        value = doc.get('participants')
+        return isinstance(value, list) and len(value) > 0
+
+    def aggregate(self, pipeline, **kwargs):
+        self.pipelines.append(pipeline)
+        exists = pipeline[0]['$match']['participants.0']['$exists']
+        matched = [doc for doc in self.docs if self._has_first_element(doc) == exists]
+        if exists:
+            return [{'_id': name} for name in {n for doc in matched for n in doc['participants']}]
+        return [
+            {'transcript': doc.get('transcript'), 'content': doc.get('content')}
+            for doc in matched if doc.get('transcript') or doc.get('content')
+        ]
+
+
+def test_get_all_participants_covers_non_array_participants():
+    """participants가 배열이 아닌 문서(문자열)도 transcript 파싱 경로에 포함되는지 테스트"""
+    docs = [
+        {'participants': ['Alice'], 'transcript': '[00:00:01] Ignored: hi'},
+        {'participants': 'Bob', 'title': 't', 'transcript': '[00:00:01] Carol: 안녕하세요'},
+        {'participants': [], 'title': 't', 'transcript': '[00:00:01] Dave: hello'},
+        {'title': 't', 'transcript': '[00:00:01] Erin: hey'},
+    ]
+    analyzer = _analyzer()
+    analyzer.collection = _FakeParticipantsCollection(docs)
+
+    participants = core.get_all_participants(analyzer)
+
+    assert participants == ['Alice', 'Carol', 'Dave', 'Erin']
+    # 두 조건은 정확히 여집합
+    first, second = analyzer.collection.pipelines
+    assert first[0]['$match'] == {'participants.0': {'$exists': True}}
+    assert second[0]['$match']['participants.0'] == {'$exists': False}
@@ -4,27 +4,194 @@ MongoDB Transcript 파싱 대화형 인터페이스
 """
 
 import os
+import random
+import re
 import sys
-import json
+import time
+import traceback
 from datetime import datetime
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dotenv import load_dotenv
+from bson import ObjectId
 
 # 상위 디렉토리를 경로에 추가
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from meeting_performance_analyzer import MeetingPerformanceAnalyzer
+from meeting_performance_analyzer import MeetingPerformanceAnalyzer, PARTICIPANT_NAME_MAPPING
 from prompt_templates import PromptTemplates
 from transcript_parser_core import (
     get_all_participants,
     test_all_transcripts,
     test_with_filters,
-    convert_objectid
+    parse_and_stats,
+    clear_parse_cache,
+    to_columns,
+    write_json
 )
 
 # .env 파일에서 환경 변수 로드
 load_dotenv()
 
+# 개별 분석 시 동시에 실행할 Gemini API 요청 수
+ANALYSIS_MAX_WORKERS = int(os.getenv('ANALYSIS_MAX_WORKERS', '4'))
+
+# 요청 한도 초과(429) 시 재시도 횟수와 첫 대기 시간 (초, 재시도마다 2배)
+ANALYSIS_MAX_RETRIES = int(os.getenv('ANALYSIS_MAX_RETRIES', '3'))
+ANALYSIS_RETRY_DELAY = float(os.getenv('ANALYSIS_RETRY_DELAY', '2'))
+
+# Gemini 요청 한도 초과 오류 메시지 (google.api_core.exceptions.ResourceExhausted 등)
+_RATE_LIMIT_RE = re.compile(r'\b429\b|resource\s+(?:has\s+been\s+)?exhausted|rate\s*limit|quota', re.IGNORECASE)
+
+# 원본 회의 저장 시 한 번의 $in 쿼리로 다시 조회할 최대 _id 수
+ORIGINAL_FETCH_CHUNK = 1000
+
+# 회의 목록 미리보기용 발언자 추출 패턴 ([00:01:23] 김민수: ...)
+SPEAKER_RE = re.compile(r'\[[\d:]+\]\s*([^:]+):')
+
+# 파일명에 사용할 수 없는 문자 (한글 등 유니코드 문자/숫자, 공백, -, _만 유지)
+_UNSAFE_FILENAME_RE = re.compile(r'[^\w -]')
+
+# 결과 파일 저장 디렉토리 (실행 위치 기준, 처음 저장할 때 한 번만 생성)
+_OUTPUT_DIR = os.path.join(os.getcwd(), "output")
+_output_dir_ready = False
+
+
+def _ensure_output_dir():
+    """
+    결과 저장 디렉토리를 한 번만 생성하고 경로 반환
+    
+    Returns:
+        결과 저장 디렉토리 경로
+    """
+    global _output_dir_ready
+    if not _output_dir_ready:
+        os.makedirs(_OUTPUT_DIR, exist_ok=True)
+        _output_dir_ready = True
+    return _OUTPUT_DIR
+
+
+# 참여자 목록 캐시 {id(analyzer): (조회 시각, 참여자 목록)}
+_PARTICIPANTS_CACHE = {}
+
+
+def _cached_participants(analyzer, ttl=300):
+    """
+    get_all_participants 결과를 TTL 동안 재사용
+    
+    필터를 다시 구성할 때마다 컬렉션 전체를 조회하지 않도록 함.
+    
+    Args:
+        analyzer: MeetingPerformanceAnalyzer 인스턴스
+        ttl: 캐시 유지 시간 (초, 기본값: 300)
+        
+    Returns:
+        정렬된 참여자 목록
+    """
+    cached = _PARTICIPANTS_CACHE.get(id(analyzer))
+    if cached and time.monotonic() - cached[0] < ttl:
+        return cached[1]
+    
+    participants = get_all_participants(analyzer)
+    _PARTICIPANTS_CACHE[id(analyzer)] = (time.monotonic(), participants)
+    return participants
+
+
+def _merge_filter(filters, condition):
+    """
+    기존 MongoDB 필터에 조건을 AND로 결합
+    
+    Args:
+        filters: 기존 MongoDB 쿼리 필터 (비어 있을 수 있음)
+        condition: 추가할 조건
+        
+    Returns:
+        결합된 필터
+    """
+    if not filters:
+        return condition
+    
+    # $and가 이미 있으면 배열에 추가, 없으면 기존 필터를 $and로 감싸서 결합
+    if '$and' in filters:
+        filters['$and'].append(condition)
+        return filters
+    return {'$and': [filters, condition]}
+
+
+def _participant_aliases(name):
+    """
+    정규화된 참여자 이름으로 정규화되는 원본 표기 목록 (이름 자신 + 매핑의 별칭들)
+    
+    Args:
+        name: 정규화된 참여자 이름
+        
+    Returns:
+        원본 표기 리스트
+    """
+    return [name] + [alias for alias, standard in PARTICIPANT_NAME_MAPPING.items() if standard == name]
+
+
+def _alias_regex(alias):
+    """
+    원본 표기 하나에 대한 정규식 (공백 변형과 "이름[ 소속 ]" 형태의 대괄호 접미사 허용)
+    
+    Args:
+        alias: 원본 표기
+        
+    Returns:
+        정규식 문자열
+    """
+    return r'\s+'.join(re.escape(part) for part in alias.split()) + r'(?:\s*\[[^\]\n]*\])?'
+
+
+def _participant_filter(names):
+    """
+    선택한 참여자 중 한 명 이상이 포함될 수 있는 회의를 찾는 MongoDB 조건 생성
+    
+    DB 단계에서 후보를 줄이기 위한 사전 필터(상위 집합)일 뿐이며, 정확한 일치 여부는
+    파싱된 발언자 이름(정규화됨)으로 post_filters['participants']에서 판단함.
+    선택한 이름을 원본 별칭으로 확장해 participants 배열과 비교하고,
+    transcript/content는 줄 시작(또는 타임스탬프 바로 뒤)의 '이름:' 발언 패턴으로만 매칭
+    
+    Args:
+        names: 정규화된 참여자 이름 리스트
+        
+    Returns:
+        MongoDB 쿼리 조건
+    """
+    aliases = [alias for name in names for alias in _participant_aliases(name)]
+    alias_regex = '(?:' + '|'.join(_alias_regex(alias) for alias in aliases) + ')'
+    speaker_regex = '^\ufeff?' + r'[ \t]*(?:\[?\d{2}:\d{2}(?::\d{2})?\]?[ \t]*)?' + alias_regex + r'[ \t]*:'
+    return {
+        '$or': [
+            {'participants': {'$in': aliases}},
+            {'participants': {'$regex': '^' + alias_regex + r'\s*$'}},
+            {'transcript': {'$regex': speaker_regex, '$options': 'm'}},
+            {'content': {'$regex': speaker_regex, '$options': 'm'}}
+        ]
+    }
+
+
+def _apply_participant_filter(filters, post_filters, names, analyzer=None):
+    """
+    참여자 필터 적용 (정확한 일치는 post_filters, DB 조건은 사전 필터)
+    
+    Args:
+        filters: 기존 MongoDB 쿼리 필터
+        post_filters: 파싱 후 필터 조건 (participants 키에 정규화된 이름 리스트를 저장)
+        names: 선택/입력한 참여자 이름 리스트
+        analyzer: MeetingPerformanceAnalyzer 인스턴스 (있으면 입력한 이름을 정규화)
+        
+    Returns:
+        결합된 MongoDB 쿼리 필터
+    """
+    if analyzer:
+        names = [analyzer._normalize_participant_name(name) for name in names]
+    names = list(dict.fromkeys(name.strip() for name in names))
+    post_filters['participants'] = names
+    return _merge_filter(filters, _participant_filter(names))
+
 
 def build_filters(analyzer=None):
     """
@@ -97,6 +264,8 @@ def build_filters(analyzer=None):
         else:
             from datetime import timedelta
             
+            # date 필드에 datetime 범위 조건을 그대로 사용 ($expr 등으로 감싸지 않아야 인덱스 사용)
+            # createdTime 스키마는 fetch_meeting_records가 동일 조건을 $or로 자동 적용
             if date_choice == 'a':
                 try:
                     days = int(input("   최근 며칠? (기본값: 30): ").strip() or "30")
@@ -163,22 +332,17 @@ def build_filters(analyzer=None):
             keyword = input("\n📝 제목 키워드 (부분 일치, x로 취소/메인 메뉴로 돌아가기): ").strip()
             if keyword and keyword.lower() not in ['x', 'cancel']:
                 # title 또는 name 필드에 키워드가 포함된 경우
+                # 키워드는 문자 그대로 일치시킴 (괄호 등 정규식 특수문자 이스케이프)
+                # title/name 인덱스가 있으면 $or의 각 조건이 문서 대신 인덱스 키만 스캔함
+                keyword_pattern = re.escape(keyword)
                 title_filter = {
                     '$or': [
-                        {'title': {'$regex': keyword, '$options': 'i'}},
-                        {'name': {'$regex': keyword, '$options': 'i'}}
+                        {'title': {'$regex': keyword_pattern, '$options': 'i'}},
+                        {'name': {'$regex': keyword_pattern, '$options': 'i'}}
                     ]
                 }
                 # 기존 필터와 AND로 결합
-                if filters:
-                    # $and가 이미 있으면 배열에 추가, 없으면 새로 생성
-                    if '$and' in filters:
-                        filters['$and'].append(title_filter)
-                    else:
-                        # 기존 필터를 $and로 감싸고 title_filter 추가
-                        filters = {'$and': [filters, title_filter]}
-                else:
-                    filters = title_filter
+                filters = _merge_filter(filters, title_filter)
                 print(f"   ✅ 제목 키워드 필터 적용: '{keyword}'")
             elif keyword.lower() in ['x', 'cancel']:
                 print("\n⏪ 필터 선택을 취소하고 메인 메뉴로 돌아갑니다.")
@@ -204,15 +368,14 @@ def build_filters(analyzer=None):
             
             if analyzer:
                 # 참여자 목록 가져오기 (취소 확인 후에만)
-                participants_list = get_all_participants(analyzer)
+                participants_list = _cached_participants(analyzer)
                 
                 if not participants_list:
                     print("\n   ⚠️  참여자 목록을 가져올 수 없습니다. 이름을 직접 입력하세요.")
                     participant = input("   👤 참여자 이름 (정확히 일치, x로 취소/메인 메뉴로 돌아가기): ").strip()
                     if participant and participant.lower() not in ['x', 'cancel']:
-                        post_filters['participants'] = participant
+                        filters = _apply_participant_filter(filters, post_filters, [participant], analyzer)
                         print(f"   ✅ 참여자 필터 적용: '{participant}'")
-                        print("   ⚠️  참여자는 파싱 후 필터링됩니다.")
                     elif participant.lower() in ['x', 'cancel']:
                         print("\n⏪ 필터 선택을 취소하고 메인 메뉴로 돌아갑니다.")
                         return None, None
@@ -237,15 +400,9 @@ def build_filters(analyzer=None):
                             selected_participants = [participants_list[i] for i in selected_indices if 0 <= i < len(participants_list)]
                             
                             if selected_participants:
-                                if len(selected_participants) == 1:
-                                    post_filters['participants'] = selected_participants[0]
-                                    print(f"   ✅ 참여자 필터 적용: '{selected_participants[0]}'")
-                                else:
-                                    # 여러 명 선택 시 첫 번째만 사용 (또는 OR 조건으로 확장 가능)
-                                    post_filters['participants'] = selected_participants[0]
-                                    print(f"   ✅ 참여자 필터 적용: '{selected_participants[0]}' (첫 번째 선택)")
-                                    print(f"   ℹ️  여러 명 선택 시 첫 번째 참여자만 필터로 사용됩니다.")
-                                print("   ⚠️  참여자는 파싱 후 필터링됩니다.")
+                                # 여러 명 선택 시 한 명이라도 포함된 회의 (OR 조건)
+                                filters = _apply_participant_filter(filters, post_filters, selected_participants, analyzer)
+                                print(f"   ✅ 참여자 필터 적용: {', '.join(repr(p) for p in selected_participants)}")
                             else:
                                 print("   ⚠️  유효한 선택이 없습니다.")
                         except (ValueError, IndexError):
@@ -254,16 +411,14 @@ def build_filters(analyzer=None):
                             if participant.lower() in ['x', 'cancel']:
                                 print("\n⏪ 필터 선택을 취소하고 메인 메뉴로 돌아갑니다.")
                                 return None, None
-                            post_filters['participants'] = participant
+                            filters = _apply_participant_filter(filters, post_filters, [participant], analyzer)
                             print(f"   ✅ 참여자 필터 적용: '{participant}'")
-                            print("   ⚠️  참여자는 파싱 후 필터링됩니다.")
                     else:
                         # 직접 입력
                         participant = input("   👤 참여자 이름 (정확히 일치, x로 취소/메인 메뉴로 돌아가기): ").strip()
                         if participant and participant.lower() not in ['x', 'cancel']:
-                            post_filters['participants'] = participant
+                            filters = _apply_participant_filter(filters, post_filters, [participant], analyzer)
                             print(f"   ✅ 참여자 필터 적용: '{participant}'")
-                            print("   ⚠️  참여자는 파싱 후 필터링됩니다.")
                         elif participant.lower() in ['x', 'cancel']:
                             print("\n⏪ 필터 선택을 취소하고 메인 메뉴로 돌아갑니다.")
                             return None, None
@@ -271,9 +426,8 @@ def build_filters(analyzer=None):
                 # analyzer가 없으면 직접 입력
                 participant = input("\n👤 참여자 이름 (정확히 일치, x로 취소/메인 메뉴로 돌아가기): ").strip()
                 if participant and participant.lower() not in ['x', 'cancel']:
-                    post_filters['participants'] = participant
+                    filters = _apply_participant_filter(filters, post_filters, [participant], analyzer)
                     print(f"   ✅ 참여자 필터 적용: '{participant}'")
-                    print("   ⚠️  참여자는 파싱 후 필터링됩니다.")
                 elif participant.lower() in ['x', 'cancel']:
                     print("\n⏪ 필터 선택을 취소하고 메인 메뉴로 돌아갑니다.")
                     return None, None
@@ -332,6 +486,66 @@ def build_filters(analyzer=None):
 
 
 
+# 회의 목록 표시에 필요한 필드만 가져오기 (transcript/content는 참여자 추출용 앞부분만)
+_MEETING_LIST_PROJECTION = {
+    'title': 1,
+    'name': 1,
+    'date': 1,
+    'createdTime': 1,
+    'participants': 1,
+    'transcript': {'$substrCP': ['$transcript', 0, 5000]},
+    'content': {'$substrCP': ['$content', 0, 5000]}
+}
+
+# 최신순 정렬 키 (standard 스키마의 date, 없으면 Google Drive 스키마의 createdTime)
+# 두 스키마가 섞인 컬렉션에서도 하나의 날짜 순서로 정렬되도록 합친 값으로 정렬하고,
+# 같은 날짜끼리는 _id 순으로 고정해 페이지 내용과 목록 번호가 바뀌지 않도록 함
+_MEETING_LIST_SORT_STAGES = [
+    {'$project': {'_sort_date': {'$ifNull': ['$date', '$createdTime']}}},
+    {'$sort': {'_sort_date': -1, '_id': 1}}
+]
+
+
+def _meeting_list_ids(analyzer, skip, limit):
+    """
+    회의 목록 순서(최신순)에서 skip번째부터 limit개의 _id만 가져옴
+    
+    Args:
+        analyzer: MeetingPerformanceAnalyzer 인스턴스
+        skip: 건너뛸 회의 수
+        limit: 가져올 회의 수
+        
+    Returns:
+        _id 리스트 (목록 순서)
+    """
+    pipeline = _MEETING_LIST_SORT_STAGES + [{'$skip': skip}, {'$limit': limit}]
+    return [doc['_id'] for doc in analyzer.collection.aggregate(pipeline, allowDiskUse=True)]
+
+
+def _fetch_meeting_page(analyzer, page, page_size):
+    """
+    회의 목록의 한 페이지만 MongoDB에서 정렬/페이지네이션하여 가져옴
+    
+    정렬은 _id와 정렬 키만으로 하고, 표시용 필드는 해당 페이지의 _id로만 조회함
+    
+    Args:
+        analyzer: MeetingPerformanceAnalyzer 인스턴스
+        page: 페이지 번호 (0부터 시작)
+        page_size: 페이지당 회의 수
+        
+    Returns:
+        표시용 필드만 포함된 회의 문서 리스트
+    """
+    ids = _meeting_list_ids(analyzer, page * page_size, page_size)
+    if not ids:
+        return []
+    docs = {
+        doc['_id']: doc
+        for doc in analyzer.collection.find({'_id': {'$in': ids}}, _MEETING_LIST_PROJECTION)
+    }
+    return [docs[_id] for _id in ids if _id in docs]
+
+
 def _select_individual_meeting(analyzer):
     """
     페이지네이션을 사용하여 개별 회의 선택
@@ -342,30 +556,32 @@ def _select_individual_meeting(analyzer):
     Returns:
         선택된 회의 문서 또는 None (취소 시)
     """
-    # 모든 회의 가져오기 (최신순)
-    all_meetings = list(analyzer.collection.find())
+    # 전체 문서를 가져오지 않고 개수만 확인 (목록은 페이지 단위로 조회)
+    total_count = analyzer.collection.estimated_document_count()
     
-    # Sort by date or createdTime (support both schemas)
-    all_meetings.sort(key=lambda m: m.get('date') or m.get('createdTime') or '', reverse=True)
-    
-    if not all_meetings:
+    if not total_count:
         print("❌ 회의 데이터가 없습니다.")
         return None
     
     page_size = 5
     current_page = 0
-    total_pages = (len(all_meetings) + page_size - 1) // page_size
+    total_pages = (total_count + page_size - 1) // page_size
+    # 이미 조회한 페이지 캐시 (이전/다음 페이지 이동 시 재조회 방지)
+    pages = {}
     
     while True:
         # 현재 페이지의 회의 목록
         start_idx = current_page * page_size
-        end_idx = min(start_idx + page_size, len(all_meetings))
-        page_meetings = all_meetings[start_idx:end_idx]
+        if current_page not in pages:
+            pages[current_page] = _fetch_meeting_page(analyzer, current_page, page_size)
+        page_meetings = pages[current_page]
         
-        # 페이지 표시
-        print("\n" + "="*80)
-        print(f"📋 회의 목록 (페이지 {current_page + 1}/{total_pages})")
-        print("="*80)
+        # 페이지 표시 (페이지 전체를 한 번에 출력)
+        lines = [
+            "\n" + "="*80,
+            f"📋 회의 목록 (페이지 {current_page + 1}/{total_pages})",
+            "="*80
+        ]
         
         for i, meeting in enumerate(page_meetings, 1):
             global_idx = start_idx + i
@@ -379,22 +595,22 @@ def _select_individual_meeting(analyzer):
             participants = meeting.get('participants', [])
             if not participants:
                 # Try to extract from transcript
-                import re
                 transcript = meeting.get('transcript') or meeting.get('content', '')
                 if transcript:
                     # Quick extraction of unique speakers (simplified)
-                    speaker_pattern = r'\[[\d:]+\]\s*([^:]+):'
-                    matches = re.findall(speaker_pattern, transcript[:5000])  # First 5000 chars
+                    matches = SPEAKER_RE.findall(transcript, 0, 5000)  # First 5000 chars
                     participants = list(dict.fromkeys(matches))  # Preserve order, remove duplicates
             
             participants_str = ', '.join(participants[:3]) if participants else '참여자 정보 없음'
             if len(participants) > 3:
                 participants_str += f' (+{len(participants) - 3}명)'
             
-            print(f"{global_idx}. {title}")
-            print(f"   📅 {date}")
-            print(f"   👥 {participants_str}")
-            print()
+            lines.append(f"{global_idx}. {title}")
+            lines.append(f"   📅 {date}")
+            lines.append(f"   👥 {participants_str}")
+            lines.append("")
+        
+        print("\n".join(lines))
         
         # 네비게이션 옵션
         print("-" * 80)
@@ -421,17 +637,58 @@ def _select_individual_meeting(analyzer):
             current_page -= 1
         elif choice.isdigit():
             idx = int(choice) - 1
-            if 0 <= idx < len(all_meetings):
-                selected = all_meetings[idx]
+            if 0 <= idx < total_count:
+                if start_idx <= idx < start_idx + len(page_meetings):
+                    meeting_id = page_meetings[idx - start_idx]['_id']
+                else:
+                    # 다른 페이지의 번호를 입력한 경우 해당 위치의 _id만 조회
+                    located = _meeting_list_ids(analyzer, idx, 1)
+                    if not located:
+                        print("⚠️  해당 번호의 회의를 찾을 수 없습니다.")
+                        continue
+                    meeting_id = located[0]
+                
+                # 선택된 회의만 전체 문서로 가져오기
+                selected = analyzer.collection.find_one({'_id': meeting_id})
+                if selected is None:
+                    print("⚠️  선택된 회의를 찾을 수 없습니다.")
+                    continue
                 title = selected.get('title', 'Untitled')
                 print(f"\n✅ 선택된 회의: {title}")
                 return selected
             else:
-                print(f"⚠️  잘못된 번호입니다. 1~{len(all_meetings)} 사이의 숫자를 입력하세요.")
+                print(f"⚠️  잘못된 번호입니다. 1~{total_count} 사이의 숫자를 입력하세요.")
         else:
             print("⚠️  잘못된 입력입니다.")
 
 
+def _ensure_indexes(analyzer):
+    """
+    필터/정렬에 사용하는 필드의 인덱스 생성 (이미 있으면 무시됨)
+    
+    date/createdTime 범위 조건이 COLLSCAN 대신 인덱스 범위 스캔을 사용하고,
+    title/name 키워드 조건이 문서 대신 인덱스 키만 검사하도록 함.
+    participants는 multikey 인덱스로 참여자 조회/필터에 사용.
+    권한이 없는 계정에서도 동작해야 하므로 실패는 경고만 출력.
+    
+    Args:
+        analyzer: MeetingPerformanceAnalyzer 인스턴스
+    """
+    index_specs = [
+        [('date', -1), ('createdTime', -1)],
+        [('createdTime', -1)],
+        [('title', 1)],
+        [('name', 1)],
+        [('participants', 1)],
+    ]
+    
+    for keys in index_specs:
+        try:
+            analyzer.collection.create_index(keys)
+        except Exception as e:
+            print(f"   ⚠️  인덱스 생성 실패 ({keys[0][0]}): {e}")
+
+
 def _get_analyzer():
     """
     환경 변수에서 설정을 읽어 MeetingPerformanceAnalyzer 인스턴스 생성
@@ -453,7 +710,7 @@ def _get_analyzer():
     MONGODB_AUTH_DATABASE = os.getenv('MONGODB_AUTH_DATABASE')
     MONGODB_URI = os.getenv('MONGODB_URI')
     
-    return MeetingPerformanceAnalyzer(
+    analyzer = MeetingPerformanceAnalyzer(
         gemini_api_key=GEMINI_API_KEY,
         database_name=DATABASE_NAME,
         collection_name=COLLECTION_NAME,
@@ -464,6 +721,10 @@ def _get_analyzer():
         mongodb_auth_database=MONGODB_AUTH_DATABASE,
         mongodb_uri=MONGODB_URI
     )
+    
+    _ensure_indexes(analyzer)
+    
+    return analyzer
 
 
 def _save_parsed_results(result, output_dir=None):
@@ -498,24 +759,39 @@ def _save_parsed_results(result, output_dir=None):
             "parsed_meetings": result['parsed_meetings']
         }
     
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(output_data, f, ensure_ascii=False, indent=2, default=str)
+    write_json(output_file, output_data)
     
     print(f"\n💾 파싱 결과를 '{output_file}' 파일에 저장했습니다.")
     print(f"   총 {len(result['parsed_meetings'])}개의 회의 파싱 결과가 저장되었습니다.")
 
 
-def _save_original_meetings(result, output_dir=None):
+def _save_original_meetings(result, output_dir=None, analyzer=None):
     """
     원본 쿼리 결과를 JSON 파일로 저장
     
+    result['meetings']는 파싱에 필요한 필드만 조회한 것이므로,
+    analyzer가 있으면 같은 회의를 projection 없이 다시 조회해 전체 문서를 저장함
+    
     Args:
         result: test_all_transcripts 또는 test_with_filters의 결과
         output_dir: 출력 파일을 저장할 디렉토리 (None이면 현재 스크립트 디렉토리)
+        analyzer: MeetingPerformanceAnalyzer 인스턴스 (None이면 조회된 필드만 저장)
     """
     if output_dir is None:
         output_dir = os.getcwd()
     
+    meetings = result['meetings']
+    if analyzer:
+        # _id 인덱스로 전체 문서를 다시 가져오고 원래 순서를 유지
+        # (회의가 많아도 쿼리 문서가 커지지 않도록 ORIGINAL_FETCH_CHUNK개씩 나눠 조회)
+        ids = [m['_id'] for m in meetings if '_id' in m]
+        full_docs = {}
+        for start in range(0, len(ids), ORIGINAL_FETCH_CHUNK):
+            chunk = ids[start:start + ORIGINAL_FETCH_CHUNK]
+            for doc in analyzer.iter_meeting_records({'_id': {'$in': chunk}}):
+                full_docs[doc['_id']] = doc
+        meetings = [full_docs.get(m.get('_id'), m) for m in meetings]
+    
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     output_file = os.path.join(output_dir, f"original_meetings_{timestamp}.json")
     
@@ -527,21 +803,20 @@ def _save_original_meetings(result, output_dir=None):
                 "mongodb_filters": result.get('filters'),
                 "post_filters": result.get('post_filters')
             },
-            "total_meetings": len(result['meetings']),
-            "original_meetings": [convert_objectid(meeting) for meeting in result['meetings']]
+            "total_meetings": len(meetings),
+            "original_meetings": meetings
         }
     else:
         output_data = {
             "generated_at": datetime.now().isoformat(),
-            "total_meetings": len(result['meetings']),
-            "original_meetings": [convert_objectid(meeting) for meeting in result['meetings']]
+            "total_meetings": len(meetings),
+            "original_meetings": meetings
         }
     
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(output_data, f, ensure_ascii=False, indent=2, default=str)
+    write_json(output_file, output_data)
     
     print(f"\n💾 원본 쿼리 결과를 '{output_file}' 파일에 저장했습니다.")
-    print(f"   총 {len(result['meetings'])}개의 원본 회의 데이터가 저장되었습니다.")
+    print(f"   총 {len(meetings)}개의 원본 회의 데이터가 저장되었습니다.")
 
 
 def _ask_save_option(prompt):
@@ -563,6 +838,133 @@ def _ask_save_option(prompt):
     return choice == 'y' or choice == 'yes'
 
 
+def _write_analysis_file(output_dir, res, timestamp, seq):
+    """
+    개별 회의 분석 결과를 마크다운 파일로 저장
+    
+    Args:
+        output_dir: 저장할 디렉토리
+        res: 분석 결과 ({'title', 'date', 'template', 'analysis'})
+        timestamp: 파일명에 붙일 저장 시각 문자열
+        seq: 같은 배치 안에서의 순번 (파일명 중복 방지)
+        
+    Returns:
+        저장된 파일 경로
+    """
+    safe_title = _UNSAFE_FILENAME_RE.sub('', res['title']).strip().replace(' ', '_')
+    filename = os.path.join(output_dir, f"analysis_{safe_title}_{timestamp}_{seq:03d}.md")
+    with open(filename, 'w', encoding='utf-8') as f:
+        f.write(f"# Analysis Result: {res['title']}\n\n")
+        f.write(f"Date: {res['date']}\n")
+        f.write(f"Template: {res['template']}\n\n")
+        f.write(res['analysis'])
+    return filename
+
+
+def _analyze_with_retry(analyzer, formatted_text, stats, **kwargs):
+    """
+    analyze_participant_performance를 조용히 호출하고, 요청 한도 초과(429)면 지수 백오프로 재시도
+    
+    스레드 풀 워커에서 호출되므로 출력하지 않음 (진행 상황은 메인 스레드에서 출력)
+    
+    Args:
+        analyzer: MeetingPerformanceAnalyzer 인스턴스
+        formatted_text: 포맷된 transcript 텍스트
+        stats: 참여자별 통계
+        **kwargs: analyze_participant_performance에 전달할 나머지 인자
+        
+    Returns:
+        분석 결과 딕셔너리
+    """
+    delay = ANALYSIS_RETRY_DELAY
+    for attempt in range(ANALYSIS_MAX_RETRIES + 1):
+        result = analyzer.analyze_participant_performance(formatted_text, stats, verbose=False, **kwargs)
+        if result.get('status') == 'success' or attempt == ANALYSIS_MAX_RETRIES:
+            return result
+        if not _RATE_LIMIT_RE.search(result.get('error') or ''):
+            return result
+        # 동시에 실패한 요청들이 같은 시각에 다시 몰리지 않도록 대기 시간에 무작위 값을 더함
+        time.sleep(delay + random.uniform(0, delay))
+        delay *= 2
+    return result
+
+
+def _save_one(output_dir, res, timestamp, seq):
+    """
+    스레드 풀 작업 단위: 분석 결과 하나를 저장하고 결과를 튜플로 반환
+    
+    출력은 호출 측에서 순서대로 하도록 워커 안에서는 print하지 않음
+    
+    Returns:
+        (성공 여부, 회의 제목, 저장된 파일 경로 또는 예외)
+    """
+    try:
+        return True, res['title'], _write_analysis_file(output_dir, res, timestamp, seq)
+    except Exception as e:
+        return False, res['title'], e
+
+
+@lru_cache(maxsize=1024)
+def _fmt_date(date):
+    """
+    표에 넣을 날짜 문자열 (datetime이면 YYYY-MM-DD, 아니면 문자열 그대로)
+    
+    같은 날짜 값이 반복되는 경우가 많아 변환 결과를 캐시함
+    (대화형 세션이 길어져도 메모리가 늘지 않도록 최근 1024개만 유지)
+    """
+    return date.strftime('%Y-%m-%d') if hasattr(date, 'strftime') else str(date)
+
+
+def _write_meeting_table_parquet(output_file, meetings):
+    """
+    종합 분석에 사용된 회의 목록을 parquet 파일로 저장 (선택 기능)
+    
+    pandas는 이 기능에서만 쓰이므로 호출 시점에 import하며,
+    pandas 또는 parquet 엔진(pyarrow)이 없으면 경고만 출력하고 건너뜀
+    
+    Args:
+        output_file: 저장할 .parquet 파일 경로
+        meetings: 회의 문서 리스트
+        
+    Returns:
+        저장된 파일 경로 (저장하지 못한 경우 None)
+    """
+    try:
+        import pandas as pd
+    except ImportError:
+        print("⚠️  pandas가 설치되어 있지 않아 회의 목록 parquet 저장을 건너뜁니다.")
+        return None
+    
+    # 행마다 dict를 만들지 않고 열 단위 리스트로 DataFrame 구성
+    columns = to_columns(
+        meetings,
+        ('date', 'title', 'participants'),
+        {'date': 'Unknown', 'title': 'Untitled', 'participants': []}
+    )
+    columns['date'] = [_fmt_date(date) for date in columns['date']]
+    columns['participants'] = [list(names) for names in columns['participants']]
+    df = pd.DataFrame(columns)
+    try:
+        df.to_parquet(output_file, compression='zstd', index=False)
+    except ImportError as e:
+        print(f"⚠️  parquet 엔진이 없어 회의 목록 저장을 건너뜁니다: {e}")
+        return None
+    return output_file
+
+
+def _collect_participants(parsed_meetings):
+    """
+    파싱된 회의들의 참여자를 합쳐 정렬된 목록으로 반환
+    
+    Args:
+        parsed_meetings: 파싱된 회의 리스트
+        
+    Returns:
+        정렬된 참여자 목록
+    """
+    return sorted(set().union(*(m.get('participants', []) for m in parsed_meetings)))
+
+
 def _interactive_analysis(analyzer, parsed_result, skip_mode_selection=False):
     """
     파싱된 결과에 대해 대화형으로 분석 수행
@@ -614,36 +1016,49 @@ def _interactive_analysis(analyzer, parsed_result, skip_mode_selection=False):
             
             break
             
+    # my_summary 선택 시 사용하는 참여자 목록 (처음 필요할 때 계산)
+    sorted_participants = None
+    
+    # 회의별 분석용 포맷팅 텍스트 캐시 (이 함수가 끝나면 함께 해제됨)
+    formatted_cache = {}
+    
+    # 분석 모드에 따른 템플릿 필터링 (모드는 루프 안에서 바뀌지 않으므로 한 번만 계산)
+    all_templates = PromptTemplates.list_templates()
+    aggregated_templates = ['comprehensive_review', 'project_milestone', 'soft_skills_growth', 'my_summary', 'performance_ranking', 'daily_report']
+    
+    if mode == "1": # 개별 분석
+        # 종합 분석용 템플릿 제외
+        filtered_templates = {k: v for k, v in all_templates.items() if k not in aggregated_templates}
+    else: # 종합 분석
+        # 종합 분석용 템플릿만 포함
+        filtered_templates = {k: v for k, v in all_templates.items() if k in aggregated_templates}
+        
+    template_names = sorted(filtered_templates.keys())
+    
+    if not template_names:
+        print("⚠️  사용 가능한 템플릿이 없습니다.")
+        return
+    
+    # 템플릿 메뉴 문자열 (한 번만 만들어 매번 한 번에 출력)
+    menu_lines = []
+    for i, name in enumerate(template_names, 1):
+        desc = filtered_templates[name]
+        # 설명이 너무 길면 자르기
+        if len(desc) > 50:
+            desc = desc[:47] + "..."
+        menu_lines.append(f"{i}. {name:<20} : {desc}")
+    menu_lines.append("0. 취소")
+    template_menu = "\n".join(menu_lines)
+    
     # 템플릿 선택 루프
     while True:
+        # 이번 분석에서 저장하는 파일들이 공유할 타임스탬프 (반복마다 한 번만 생성)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        
         # 템플릿 선택
         print("\n📝 프롬프트 템플릿 선택:")
-        all_templates = PromptTemplates.list_templates()
-        
-        # 분석 모드에 따른 템플릿 필터링
-        aggregated_templates = ['comprehensive_review', 'project_milestone', 'soft_skills_growth', 'my_summary', 'performance_ranking', 'daily_report']
         
-        if mode == "1": # 개별 분석
-            # 종합 분석용 템플릿 제외
-            filtered_templates = {k: v for k, v in all_templates.items() if k not in aggregated_templates}
-        else: # 종합 분석
-            # 종합 분석용 템플릿만 포함
-            filtered_templates = {k: v for k, v in all_templates.items() if k in aggregated_templates}
-            
-        template_names = sorted(filtered_templates.keys())
-        
-        if not template_names:
-            print("⚠️  사용 가능한 템플릿이 없습니다.")
-            continue
-        
-        for i, name in enumerate(template_names, 1):
-            desc = filtered_templates[name]
-            # 설명이 너무 길면 자르기
-            if len(desc) > 50:
-                desc = desc[:47] + "..."
-            print(f"{i}. {name:<20} : {desc}")
-            
-        print("0. 취소")
+        print(template_menu)
         
         try:
             template_idx = input(f"\n선택 (1~{len(template_names)}): ").strip()
@@ -695,20 +1110,9 @@ def _interactive_analysis(analyzer, parsed_result, skip_mode_selection=False):
         # my_summary 템플릿인 경우 사용자 이름 물어보기
         user_name_instruction = ""
         if selected_template == "my_summary":
-            # 참여자 목록 추출
-            all_participants = set()
-            if mode == "1": # 개별 분석 (모든 회의)
-                for m in parsed_meetings:
-                    all_participants.update(m.get('participants', []))
-            elif mode == "2": # 종합 분석 (필터링된 회의)
-                # parsed_meetings는 이미 필터링된 목록임 (test_with_filters의 결과가 parsed_meetings라면)
-                # 하지만 여기서 parsed_meetings는 test_all_transcripts의 결과일 수도 있고 test_with_filters의 결과일 수도 있음
-                # _interactive_analysis의 인자 parsed_result 구조를 확인해야 함
-                # parsed_result['parsed_meetings']가 리스트임
-                for m in parsed_meetings:
-                    all_participants.update(m.get('participants', []))
-            
-            sorted_participants = sorted(list(all_participants))
+            # 참여자 목록 추출 (개별/종합 모두 parsed_meetings 기준, 템플릿을 다시 골라도 한 번만 계산)
+            if sorted_participants is None:
+                sorted_participants = _collect_participants(parsed_meetings)
             
             if sorted_participants:
                 print("\n👤 회의록에서 본인의 이름을 선택해주세요:")
@@ -753,29 +1157,55 @@ def _interactive_analysis(analyzer, parsed_result, skip_mode_selection=False):
                 
                 analysis_results = []
                 
-                for i, meeting in enumerate(parsed_meetings, 1):
-                    title = meeting.get('title', 'Untitled')
-                    print(f"\n[{i}/{meeting_count}] '{title}' 분석 중...")
-                    
-                    # 포맷팅된 텍스트 생성 (재사용)
-                    # 주의: meeting_performance_analyzer의 내부 로직을 일부 재구현해야 함
-                    # 여기서는 간단히 analyzer.analyze_participant_performance 호출
-                    
-                    # 필요한 데이터 재구성
-                    stats = meeting.get('participant_stats', {})
-                    parsed_transcript = meeting.get('parsed_transcript', [])
-                    
-                    # 포맷팅
-                    formatted_text = analyzer.format_transcript_for_analysis(
-                        meeting, parsed_transcript, stats
-                    )
+                # Gemini API 호출은 I/O 대기이므로 스레드 풀로 동시에 요청 (동시 요청 수 = 워커 수)
+                max_workers = max(1, min(ANALYSIS_MAX_WORKERS, meeting_count))
+                print("🤖 Gemini API로 성과 분석 중...")
+                print(f"   모델: {analyzer.model_name}")
+                print(f"   템플릿: {selected_template}")
+                print(f"   버전: {selected_version if selected_version else 'latest'}")
+                print(f"   (동시 요청 수: {max_workers})")
+                with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                    futures = {}
+                    for i, meeting in enumerate(parsed_meetings, 1):
+                        # 필요한 데이터 재구성
+                        stats = meeting.get('participant_stats', {})
+                        parsed_transcript = meeting.get('parsed_transcript', [])
+                        
+                        # 포맷팅 (다른 템플릿으로 다시 분석할 때는 캐시 재사용)
+                        cache_key = meeting.get('id') or id(meeting)
+                        formatted_text = formatted_cache.get(cache_key)
+                        if formatted_text is None:
+                            formatted_text = analyzer.format_transcript_for_analysis(
+                                meeting, parsed_transcript, stats
+                            )
+                            formatted_cache[cache_key] = formatted_text
+                        
+                        # 분석 호출 (워커는 출력하지 않음)
+                        future = pool.submit(
+                            _analyze_with_retry, analyzer,
+                            formatted_text, stats, template_override=selected_template,
+                            custom_instructions=full_instructions,
+                            version=selected_version
+                        )
+                        futures[future] = (i, meeting)
                     
-                    # 분석 호출
-                    result = analyzer.analyze_participant_performance(
-                        formatted_text, stats, template_override=selected_template,
-                        custom_instructions=full_instructions,
-                        version=selected_version
-                    )
+                    # 진행 상황은 완료되는 대로 메인 스레드에서 출력
+                    results = []
+                    for done, future in enumerate(as_completed(futures), 1):
+                        i, meeting = futures[future]
+                        try:
+                            result = future.result()
+                        except Exception as e:
+                            result = {'status': 'error', 'error': str(e)}
+                        status = "✅ 완료" if result['status'] == 'success' else "❌ 실패"
+                        print(f"   [{done}/{meeting_count}] '{meeting.get('title', 'Untitled')}' 분석 {status}")
+                        results.append((i, meeting, result))
+                
+                # 결과는 회의 순서대로 출력
+                results.sort(key=lambda item: item[0])
+                for i, meeting, result in results:
+                    title = meeting.get('title', 'Untitled')
+                    print(f"\n[{i}/{meeting_count}] '{title}' 분석 결과")
                     
                     if result['status'] == 'success':
                         print("\n" + "-"*40)
@@ -797,38 +1227,36 @@ def _interactive_analysis(analyzer, parsed_result, skip_mode_selection=False):
                 # 일괄 저장 옵션
                 if analysis_results:
                     if _ask_save_option(f"총 {len(analysis_results)}개의 분석 결과를 파일로 저장하시겠습니까?"):
-                        saved_count = 0
-                        # Output 디렉토리 생성
-                        output_dir = os.path.join(os.getcwd(), "output")
-                        os.makedirs(output_dir, exist_ok=True)
+                        # Output 디렉토리 (처음 한 번만 생성)
+                        output_dir = _ensure_output_dir()
                         
-                        for res in analysis_results:
-                            try:
-                                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                                safe_title = "".join([c for c in res['title'] if c.isalnum() or c in (' ', '-', '_')]).strip().replace(' ', '_')
-                                filename = os.path.join(output_dir, f"analysis_{safe_title}_{timestamp}.md")
-                                with open(filename, 'w', encoding='utf-8') as f:
-                                    f.write(f"# Analysis Result: {res['title']}\n\n")
-                                    f.write(f"Date: {res['date']}\n")
-                                    f.write(f"Template: {res['template']}\n\n")
-                                    f.write(res['analysis'])
-                                print(f"✅ 파일 저장 완료: {filename}")
-                                saved_count += 1
-                            except Exception as e:
-                                print(f"❌ '{res['title']}' 저장 실패: {e}")
+                        # 같은 초에 저장되는 파일끼리 덮어쓰지 않도록 반복 시작 시 만든 타임스탬프에 순번을 붙임
+                        # 파일끼리 독립적이므로 스레드 풀로 동시에 기록
+                        with ThreadPoolExecutor(max_workers=min(16, len(analysis_results))) as pool:
+                            outs = list(pool.map(
+                                lambda item: _save_one(output_dir, item[1], timestamp, item[0]),
+                                enumerate(analysis_results, 1)
+                            ))
+                        
+                        for ok, title, detail in outs:
+                            if ok:
+                                print(f"✅ 파일 저장 완료: {detail}")
+                            else:
+                                print(f"❌ '{title}' 저장 실패: {detail}")
+                        saved_count = sum(ok for ok, _, _ in outs)
                         print(f"\n💾 총 {saved_count}개의 파일이 저장되었습니다.")
                         
             elif mode == "2":
                 # 종합 분석
-                # 원본 회의 데이터가 필요함 (parsed_result['meetings']에 있음)
-                original_meetings = parsed_result.get('meetings', [])
-                if not original_meetings:
-                    print("❌ 원본 회의 데이터를 찾을 수 없어 종합 분석을 수행할 수 없습니다.")
-                    continue
-                    
-                # 필터링된 회의만 추출 (parsed_meetings에 있는 ID와 일치하는 것만)
-                target_ids = set(m['id'] for m in parsed_meetings)
-                target_meetings = [m for m in original_meetings if str(m.get('_id', '')) in target_ids]
+                # 파싱된 회의(parsed_meetings)의 원본 문서만 분석에 필요한 필드로 MongoDB에서 가져오기
+                # main에서 한 번 계산해 둔 ID 집합을 재사용 (없으면 여기서 계산)
+                target_ids = parsed_result.get('_id_set')
+                if target_ids is None:
+                    target_ids = parsed_result['_id_set'] = frozenset(m['id'] for m in parsed_meetings)
+                # 파싱 결과는 원본 _id(ObjectId)를 그대로 갖고 있으므로 변환 없이 $in 조건에 사용
+                # (이전 형식의 문자열 ID만 ObjectId로 변환)
+                target_oids = [ObjectId(i) if isinstance(i, str) and ObjectId.is_valid(i) else i for i in target_ids]
+                target_meetings = analyzer.fetch_meetings_by_ids(target_oids)
                 
                 if not target_meetings:
                     print("❌ 분석 대상 회의를 찾을 수 없습니다.")
@@ -848,39 +1276,47 @@ def _interactive_analysis(analyzer, parsed_result, skip_mode_selection=False):
                     print(result['analysis'])
                     print("=" * 60)
                     
-                    # 결과 저장 옵션
-                    if _ask_save_option("종합 분석 결과를 파일로 저장하시겠습니까?"):
+                    # 결과 저장 옵션 (저장할 분석 내용이 없으면 묻지 않음)
+                    if result.get('analysis') and _ask_save_option("종합 분석 결과를 파일로 저장하시겠습니까?"):
                         try:
-                            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                        
-                            # Output 디렉토리 생성
-                            output_dir = os.path.join(os.getcwd(), "output")
-                            os.makedirs(output_dir, exist_ok=True)
+                            # Output 디렉토리 (처음 한 번만 생성)
+                            output_dir = _ensure_output_dir()
                             
                             filename = os.path.join(output_dir, f"aggregated_analysis_{selected_template}_{timestamp}.md")
-                            with open(filename, 'w', encoding='utf-8') as f:
-                                f.write(f"# Aggregated Analysis Result\n\n")
-                                f.write(f"Date Range: {result.get('date_range', {}).get('start')} ~ {result.get('date_range', {}).get('end')}\n")
-                                f.write(f"Meeting Count: {result.get('meeting_count')}\n")
-                                f.write(f"Template: {selected_template}\n\n")
-                                
+                            # 문서 전체를 메모리에서 조립한 뒤 한 번에 기록
+                            parts = [
+                                "# Aggregated Analysis Result\n\n",
+                                f"Date Range: {result.get('date_range', {}).get('start')} ~ {result.get('date_range', {}).get('end')}\n",
+                                f"Meeting Count: {result.get('meeting_count')}\n",
+                                f"Template: {selected_template}\n\n",
                                 # 회의 목록 추가
-                                f.write("## Analyzed Meetings\n\n")
-                                f.write("| Date | Title | Participants |\n")
-                                f.write("|---|---|---|\n")
-                                for m in target_meetings:
-                                    date = m.get('date', 'Unknown')
-                                    if hasattr(date, 'strftime'):
-                                        date = date.strftime('%Y-%m-%d')
-                                    title = m.get('title', 'Untitled')
-                                    participants = ", ".join(m.get('participants', []))
-                                    f.write(f"| {date} | {title} | {participants} |\n")
-                                f.write("\n")
-                                
-                                f.write(result['analysis'])
+                                "## Analyzed Meetings\n\n",
+                                "| Date | Title | Participants |\n",
+                                "|---|---|---|\n",
+                            ]
+                            # 회의 표는 제너레이터로 행을 만들어 하나의 문자열로 합침
+                            parts.append("".join(
+                                f"| {_fmt_date(m.get('date', 'Unknown'))} | {m.get('title', 'Untitled')} | {', '.join(m.get('participants', []))} |\n"
+                                for m in target_meetings
+                            ))
+                            parts.append("\n")
+                            parts.append(result['analysis'])
+                            
+                            with open(filename, 'w', encoding='utf-8') as f:
+                                f.write(''.join(parts))
                             print(f"✅ 파일 저장 완료: {filename}")
+                            
                         except Exception as e:
                             print(f"❌ 파일 저장 실패: {e}")
+                        else:
+                            # 후속 분석용 회의 목록 parquet 사이드카 (pandas/pyarrow가 있을 때만)
+                            # 실패해도 분석 결과(.md)는 이미 저장되었으므로 따로 알림
+                            try:
+                                table_file = _write_meeting_table_parquet(filename[:-3] + ".parquet", target_meetings)
+                                if table_file:
+                                    print(f"✅ 회의 목록 저장 완료: {table_file}")
+                            except Exception as e:
+                                print(f"⚠️  회의 목록 parquet 저장 실패 (분석 결과 파일은 저장됨): {e}")
 
                 else:
                     error_msg = result.get('error') if result else "Unknown error"
@@ -892,7 +1328,6 @@ def _interactive_analysis(analyzer, parsed_result, skip_mode_selection=False):
                 
         except Exception as e:
             print(f"❌ 오류 발생: {str(e)}")
-            import traceback
             traceback.print_exc()
 
 
@@ -946,9 +1381,8 @@ def main():
                     print("\n⏪ 필터 선택이 취소되었습니다. 메인 메뉴로 돌아갑니다.")
                     continue
                 
-                # Output 디렉토리 설정
-                output_dir = os.path.join(os.getcwd(), "output")
-                os.makedirs(output_dir, exist_ok=True)
+                # Output 디렉토리 (처음 한 번만 생성)
+                output_dir = _ensure_output_dir()
                 
                 # 필터를 사용한 분석
                 result = test_with_filters(
@@ -973,18 +1407,18 @@ def main():
                     continue
                 
                 print(f"\n🔄 회의 파싱 중...")
-                parsed_transcript = analyzer.parse_transcript(transcript)
+                # 같은 회의를 다시 선택하면 캐시된 파싱/통계 결과 사용
+                parsed_transcript, participant_stats = parse_and_stats(
+                    analyzer, selected_meeting.get('_id', ''), transcript
+                )
                 
                 if not parsed_transcript:
                     print("❌ 파싱 실패: transcript를 파싱할 수 없습니다.")
                     continue
                 
-                # 참여자 통계 계산
-                participant_stats = analyzer.extract_participant_stats(parsed_transcript)
-                
                 # 파싱 결과 구성 (support both schemas)
                 parsed_meeting = {
-                    'id': str(selected_meeting.get('_id', '')),
+                    'id': selected_meeting.get('_id', ''),
                     'title': selected_meeting.get('title') or selected_meeting.get('name', 'Untitled'),
                     'date': selected_meeting.get('date') or selected_meeting.get('createdTime', 'Unknown'),
                     'participants': list(participant_stats.keys()),
@@ -1004,18 +1438,21 @@ def main():
                 _interactive_analysis(analyzer, result, skip_mode_selection=True)
                 
                 # 저장 옵션은 스킵 (개별 회의는 저장 불필요)
+                # 아래 공통 분석/저장 단계로 내려가지 않고 메인 메뉴로 돌아감
                 print("\n✅ 분석 완료!")
+                continue
                 
             else:
-                # Output 디렉토리 설정
-                output_dir = os.path.join(os.getcwd(), "output")
-                os.makedirs(output_dir, exist_ok=True)
+                # Output 디렉토리 (처음 한 번만 생성)
+                output_dir = _ensure_output_dir()
                 
                 # 모든 회의 분석
                 result = test_all_transcripts(analyzer=analyzer, output_dir=output_dir)
             
             # 파싱 결과에 대해 대화형 분석 실행
             if result and result.get('parsed_meetings'):
+                # 종합 분석 모드에 다시 들어와도 재계산하지 않도록 ID 집합을 미리 만들어 둠
+                result['_id_set'] = frozenset(m['id'] for m in result['parsed_meetings'])
                 _interactive_analysis(analyzer, result)
             
             # 파싱 완료 후 저장 여부 물어보기
@@ -1025,15 +1462,16 @@ def main():
             
             if result and result.get('meetings'):
                 if _ask_save_option("💾 원본 쿼리 결과(원본 회의 데이터)를 JSON 파일로 저장하시겠습니까?"):
-                    _save_original_meetings(result, output_dir=output_dir)
+                    _save_original_meetings(result, output_dir=output_dir, analyzer=analyzer)
             
             print("\n✅ 테스트 완료!")
             
         except Exception as e:
             print(f"\n❌ 오류 발생: {str(e)}")
-            import traceback
             traceback.print_exc()
         
+    _PARTICIPANTS_CACHE.pop(id(analyzer), None)
+    clear_parse_cache()
     analyzer.close()
 
 
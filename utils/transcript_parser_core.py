@@ -4,9 +4,51 @@ MongoDB Transcript 파싱 핵심 기능 모듈
 """
 
 import os
+import re
+import sys
 import json
-from datetime import datetime
+import hashlib
+import multiprocessing
+from datetime import date, datetime
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from array import array
+from bson import ObjectId
+from bson.codec_options import CodecOptions
+from bson.raw_bson import RawBSONDocument
+
+from meeting_fields import MEETING_ANALYSIS_PROJECTION
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# parse_and_stats 결과 캐시 {(회의 ID, transcript 해시): (parsed_transcript, participant_stats)}
+_PARSE_CACHE = {}
+_PARSE_CACHE_MAXSIZE = 128
+
+# transcript가 이 개수 이상이면 프로세스 풀로 병렬 파싱 (spawn 워커 시작 비용을 감안한 기준)
+PARSE_POOL_MIN_ITEMS = 16
+PARSE_POOL_MAX_WORKERS = int(os.getenv('PARSE_MAX_WORKERS', '0')) or None  # None이면 CPU 코어 수
+# 워커 프로세스 시작 방식 (fork는 MongoClient/gRPC 스레드가 있는 상태를 복제하므로 사용하지 않음)
+_PARSE_POOL_CONTEXT = multiprocessing.get_context('spawn')
+
+# 커서 배치 크기: transcript 본문은 배치를 작게 해 메모리 사용량을 제한하고,
+# 이름만 오는 참여자 집계는 배치를 크게 해 getMore 왕복을 줄임
+TRANSCRIPT_BATCH_SIZE = 50
+PARTICIPANT_NAME_BATCH_SIZE = 5000
+
+# 파싱 실패 원인 분류용 패턴 (대소문자 무시 검색으로 transcript 전체를 소문자로 복사하지 않음)
+_ENDED_RE = re.compile(r'transcription ended after', re.IGNORECASE)
+
+# verbose=False일 때 진행 상황을 출력하는 간격 (회의 수)
+PROGRESS_EVERY = 100
+
+# 워커 프로세스별 파서 인스턴스 {분석기 클래스: 연결 없는 인스턴스}
+_WORKER_PARSERS = {}
 
 
 def convert_objectid(obj):
@@ -23,7 +65,7 @@ def convert_objectid(obj):
         return {k: convert_objectid(v) for k, v in obj.items()}
     elif isinstance(obj, list):
         return [convert_objectid(item) for item in obj]
-    elif hasattr(obj, '__str__') and 'ObjectId' in str(type(obj)):
+    elif isinstance(obj, ObjectId):
         return str(obj)
     elif isinstance(obj, datetime):
         return obj.isoformat()
@@ -31,6 +73,195 @@ def convert_objectid(obj):
         return obj
 
 
+def _json_default(obj):
+    """
+    JSON 비호환 값 변환 (datetime/date는 convert_objectid와 같은 ISO 8601 문자열, ObjectId 등은 문자열)
+    
+    Args:
+        obj: 변환할 객체
+        
+    Returns:
+        변환된 문자열
+    """
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    return str(obj)
+
+
+def write_json(output_file, data):
+    """
+    데이터를 JSON 파일로 저장 (orjson이 설치되어 있으면 사용)
+    
+    Args:
+        output_file: 저장할 파일 경로
+        data: 저장할 데이터 (ObjectId/datetime 등 JSON 비호환 값은 _json_default로 변환)
+    """
+    if orjson is not None:
+        # datetime도 _json_default(isoformat)로 넘겨 json 경로·convert_objectid와 정확히 같은 문자열이 되도록 함
+        option = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        with open(output_file, 'wb') as f:
+            f.write(orjson.dumps(data, default=_json_default, option=option))
+    else:
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2, default=_json_default)
+
+
+def _parse_cache_key(meeting_id, transcript):
+    """parse_and_stats 캐시 키 (transcript가 바뀐 경우를 구분하기 위해 내용 해시 포함)"""
+    return (str(meeting_id), hashlib.blake2b(transcript.encode('utf-8'), digest_size=8).hexdigest())
+
+
+def _parse_cache_put(key, value):
+    """캐시에 저장하고 최대 크기를 넘으면 가장 오래 사용되지 않은 항목 제거"""
+    _PARSE_CACHE.pop(key, None)
+    if len(_PARSE_CACHE) >= _PARSE_CACHE_MAXSIZE:
+        # dict는 삽입 순서를 유지하므로 첫 항목이 가장 오래된 항목
+        _PARSE_CACHE.pop(next(iter(_PARSE_CACHE)))
+    _PARSE_CACHE[key] = value
+
+
+def parse_and_stats(analyzer, meeting_id, transcript):
+    """
+    Transcript 파싱 및 참여자 통계 계산 (같은 회의를 다시 분석하면 캐시된 결과 사용)
+    
+    Args:
+        analyzer: MeetingPerformanceAnalyzer 인스턴스
+        meeting_id: 회의 ID
+        transcript: 원본 transcript 텍스트
+        
+    Returns:
+        (parsed_transcript, participant_stats) 튜플
+        발언이 추출되지 않으면 participant_stats는 None
+    """
+    key = _parse_cache_key(meeting_id, transcript)
+    cached = _PARSE_CACHE.get(key)
+    if cached is None:
+        parsed_transcript = analyzer.parse_transcript(transcript)
+        participant_stats = analyzer.extract_participant_stats(parsed_transcript) if parsed_transcript else None
+        cached = (parsed_transcript, participant_stats)
+    
+    # 최근 사용 항목을 끝으로 이동
+    _parse_cache_put(key, cached)
+    return cached
+
+
+def _parse_worker(analyzer_cls, transcript):
+    """
+    프로세스 풀 작업 단위: transcript 하나를 파싱하고 참여자 통계 계산
+    
+    파싱/통계 메서드는 MongoDB·Gemini 연결을 쓰지 않으므로,
+    __init__을 거치지 않은 빈 인스턴스로 호출해 연결 객체를 피클링하지 않음
+    
+    Returns:
+        (parsed_transcript, participant_stats) 튜플 또는 발생한 예외
+    """
+    parser = _WORKER_PARSERS.get(analyzer_cls)
+    if parser is None:
+        parser = _WORKER_PARSERS[analyzer_cls] = object.__new__(analyzer_cls)
+    try:
+        parsed_transcript = parser.parse_transcript(transcript)
+        participant_stats = parser.extract_participant_stats(parsed_transcript) if parsed_transcript else None
+        return parsed_transcript, participant_stats
+    except Exception as e:
+        return e
+
+
+def parse_and_stats_many(analyzer, items):
+    """
+    여러 transcript를 한 번에 파싱 (항목이 많으면 프로세스 풀 사용)
+    
+    컬렉션 전체를 파싱하면 크기가 제한된 parse_and_stats 캐시는 넣은 항목을 곧바로 밀어내
+    해시 계산 비용만 들고 적중하지 않으므로, 일괄 파싱은 캐시를 거치지 않음
+    (캐시는 개별 회의를 다시 분석하는 parse_and_stats에서만 사용)
+    
+    Args:
+        analyzer: MeetingPerformanceAnalyzer 인스턴스
+        items: (회의 ID, transcript) 튜플 리스트
+        
+    Returns:
+        items와 같은 순서의 결과 리스트
+        각 항목은 (parsed_transcript, participant_stats) 튜플 또는 파싱 중 발생한 예외
+    """
+    transcripts = [transcript for _, transcript in items]
+    
+    if len(transcripts) >= PARSE_POOL_MIN_ITEMS:
+        # 항목 수보다 많은 프로세스는 만들지 않고, 워커당 약 4개 청크로 나눠 IPC 왕복을 줄임
+        workers = min(PARSE_POOL_MAX_WORKERS or os.cpu_count() or 1, len(transcripts))
+        chunksize = max(1, len(transcripts) // (workers * 4))
+        try:
+            # MongoClient/gRPC 백그라운드 스레드가 있는 프로세스를 fork하지 않도록 spawn으로 워커 시작
+            with ProcessPoolExecutor(max_workers=workers, mp_context=_PARSE_POOL_CONTEXT) as pool:
+                return list(pool.map(
+                    _parse_worker,
+                    repeat(type(analyzer)),
+                    transcripts,
+                    chunksize=chunksize
+                ))
+        except Exception as e:
+            # 프로세스를 만들 수 없는 환경이면 순차 처리로 대체
+            print(f"   ⚠️  병렬 파싱을 사용할 수 없어 순차 처리합니다: {e}")
+    
+    # 항목이 적으면 프로세스 시작 비용이 더 크므로 현재 프로세스에서 처리
+    try:
+        parsed_list = analyzer.parse_transcripts_bulk(transcripts)
+    except Exception:
+        # 일괄 파싱이 실패하면 어느 회의에서 실패했는지 구분하도록 항목별로 다시 파싱
+        parsed_list = [None] * len(transcripts)
+    
+    results = []
+    for transcript, parsed_transcript in zip(transcripts, parsed_list):
+        try:
+            if parsed_transcript is None:
+                parsed_transcript = analyzer.parse_transcript(transcript)
+            participant_stats = analyzer.extract_participant_stats(parsed_transcript) if parsed_transcript else None
+            results.append((parsed_transcript, participant_stats))
+        except Exception as e:
+            results.append(e)
+    return results
+
+
+def _parse_meetings(analyzer, meetings):
+    """
+    transcript가 있는 회의를 parse_and_stats_many로 한꺼번에 파싱
+    
+    Args:
+        analyzer: MeetingPerformanceAnalyzer 인스턴스
+        meetings: 회의 문서 리스트
+        
+    Returns:
+        {회의 순번(1부터): parse_and_stats_many 결과 항목} 딕셔너리 (transcript가 없는 회의는 제외)
+    """
+    parse_targets = [
+        (idx, (meeting.get('_id', ''), meeting.get('transcript', '')))
+        for idx, meeting in enumerate(meetings, 1)
+        if meeting.get('transcript', '')
+    ]
+    return dict(zip(
+        (idx for idx, _ in parse_targets),
+        parse_and_stats_many(analyzer, [item for _, item in parse_targets])
+    ))
+
+
+def clear_parse_cache():
+    """parse_and_stats 캐시 비우기 (분석기 연결 종료 시 호출)"""
+    _PARSE_CACHE.clear()
+
+
+def _unique_speakers(parsed_transcript):
+    """
+    파싱된 발언 리스트에서 고유 발언자 이름 집합 추출 (빈 이름 제외)
+    
+    Args:
+        parsed_transcript: analyzer.parse_transcript 결과
+        
+    Returns:
+        공백을 제거한 발언자 이름 set
+    """
+    speakers = {entry.get('speaker', '').strip() for entry in parsed_transcript}
+    speakers.discard('')
+    return speakers
+
+
 def get_all_participants(analyzer):
     """
     MongoDB에서 모든 참여자 목록을 가져옴 (효율적인 방법)
@@ -44,48 +275,74 @@ def get_all_participants(analyzer):
     print("\n📋 참여자 목록을 가져오는 중...")
     all_participants = set()
     
+    # 같은 이름이 여러 문서/발언에 반복되므로 정규화·유효성 검사 결과를 이번 실행 동안 재사용
+    norm_cache = {}
+    valid_cache = {}
+    
+    def normalize(name):
+        normalized = norm_cache.get(name)
+        if normalized is None:
+            normalized = analyzer._normalize_participant_name(name)
+            # 같은 이름 문자열을 하나의 객체로 공유 (집합 비교 시 해시/동등성 비교가 빨라짐)
+            norm_cache[name] = normalized = sys.intern(normalized) if normalized else normalized
+        return normalized
+    
+    def is_valid(name):
+        valid = valid_cache.get(name)
+        if valid is None:
+            valid = valid_cache[name] = analyzer._is_valid_participant(name)
+        return valid
+    
     try:
-        # 방법 1: MongoDB aggregation을 사용하여 participants 필드가 있는 문서에서만 추출
-        # 이 방법이 훨씬 빠름 (전체 문서를 가져오지 않고 참여자만 추출)
+        # 방법 1: participants 필드가 있는 문서는 서버에서 이름별로 묶어 고유 이름만 가져옴
+        # (distinct와 달리 결과가 16MB 단일 응답 제한에 걸리지 않고, 큰 그룹은 디스크 사용 허용)
+        unique_pipeline = [
+            # 비어 있지 않은 배열만 (방법 2의 조건과 정확히 여집합)
+            {'$match': {'participants.0': {'$exists': True}}},
+            {'$unwind': '$participants'},
+            {'$group': {'_id': '$participants'}}
+        ]
+        # 결과 문서를 dict로 디코딩하지 않고 필요한 _id 필드만 꺼내 씀
+        raw_collection = analyzer.collection.with_options(
+            codec_options=CodecOptions(document_class=RawBSONDocument)
+        )
+        raw_participants = [
+            doc['_id'] for doc in raw_collection.aggregate(
+                unique_pipeline, allowDiskUse=True, batchSize=PARTICIPANT_NAME_BATCH_SIZE
+            )
+        ]
+        for p in raw_participants:
+            if p and isinstance(p, str):
+                # 정규화된 이름으로 추가
+                normalized = normalize(p.strip())
+                if normalized and is_valid(normalized):
+                    all_participants.add(normalized)
+        
+        # 방법 2: 방법 1에서 제외된 문서(participants가 없거나 빈 배열이거나 배열이 아닌 값)는 transcript 파싱
         pipeline = [
             {
                 '$match': {
+                    'participants.0': {'$exists': False},
                     '$or': [
-                        {'participants': {'$exists': True, '$ne': None, '$ne': []}},
-                        {'transcript': {'$exists': True, '$ne': None, '$ne': ''}},
-                        {'content': {'$exists': True, '$ne': None, '$ne': ''}}
+                        {'transcript': {'$nin': [None, '']}},
+                        {'content': {'$nin': [None, '']}}
                     ]
                 }
             },
             {
+                # 파싱에 필요한 본문만 전송 (_id 제외)
                 '$project': {
-                    'participants': 1,
                     'transcript': 1,
-                    'content': 1
+                    'content': 1,
+                    '_id': 0
                 }
             }
         ]
         
-        # aggregation으로 필요한 필드만 가져오기
-        cursor = analyzer.collection.aggregate(pipeline)
-        docs_with_participants = 0
+        cursor = analyzer.collection.aggregate(pipeline, batchSize=TRANSCRIPT_BATCH_SIZE)
         docs_needing_parsing = 0
         
         for doc in cursor:
-            # participants 필드가 이미 있으면 사용
-            if 'participants' in doc and doc.get('participants'):
-                participants_list = doc.get('participants', [])
-                if isinstance(participants_list, list):
-                    for p in participants_list:
-                        if p and isinstance(p, str):
-                            # 정규화된 이름으로 추가
-                            normalized = analyzer._normalize_participant_name(p.strip())
-                            if normalized and analyzer._is_valid_participant(normalized):
-                                all_participants.add(normalized)
-                    docs_with_participants += 1
-                    continue
-            
-            # participants 필드가 없으면 transcript 파싱
             transcript = doc.get('transcript') or doc.get('content', '')
             if transcript:
                 try:
@@ -94,19 +351,19 @@ def get_all_participants(analyzer):
                     transcript_text = normalized_doc.get('transcript', '')
                     if transcript_text:
                         parsed = analyzer.parse_transcript(transcript_text)
-                        for entry in parsed:
-                            speaker = entry.get('speaker', '').strip()
-                            if speaker and analyzer._is_valid_participant(speaker):
+                        # 발언 단위가 아니라 고유 발언자 단위로 검사
+                        for speaker in _unique_speakers(parsed):
+                            if is_valid(speaker):
                                 # 정규화된 이름으로 추가
-                                normalized = analyzer._normalize_participant_name(speaker)
+                                normalized = normalize(speaker)
                                 if normalized:
                                     all_participants.add(normalized)
                         docs_needing_parsing += 1
                 except:
                     pass
         
-        if docs_with_participants > 0 or docs_needing_parsing > 0:
-            print(f"   ✓ {docs_with_participants}개 문서에서 participants 필드 사용")
+        if raw_participants or docs_needing_parsing > 0:
+            print(f"   ✓ participants 필드에서 {len(raw_participants)}개 이름 사용")
             if docs_needing_parsing > 0:
                 print(f"   ✓ {docs_needing_parsing}개 문서에서 transcript 파싱")
     
@@ -114,30 +371,32 @@ def get_all_participants(analyzer):
         print(f"   ⚠️  Aggregation 실패: {e}")
         print("   대체 방법으로 시도 중...")
         
-        # 대체 방법: 기존 방식 (전체 문서 가져오기)
-        meetings = analyzer.fetch_meeting_records({})
+        # 대체 방법: 전체 문서를 커서로 순회하되 참여자 추출에 필요한 필드만 가져오기
+        # (content만 있는 문서도 transcript를 사용할 수 있도록 정규화된 문서로 받음)
+        meetings = analyzer.iter_meeting_records(
+            projection={'participants': 1, 'transcript': 1, 'content': 1, '_id': 0},
+            batch_size=TRANSCRIPT_BATCH_SIZE
+        )
         
         for meeting in meetings:
-            # participants 필드가 이미 있으면 사용
-            if 'participants' in meeting and meeting.get('participants'):
-                participants_list = meeting.get('participants', [])
-                if isinstance(participants_list, list):
-                    for p in participants_list:
-                        if p and isinstance(p, str):
-                            normalized = analyzer._normalize_participant_name(p.strip())
-                            if normalized and analyzer._is_valid_participant(normalized):
-                                all_participants.add(normalized)
+            # participants 필드가 비어 있지 않은 배열이면 사용
+            participants_list = meeting.get('participants')
+            if isinstance(participants_list, list) and participants_list:
+                for p in participants_list:
+                    if p and isinstance(p, str):
+                        normalized = normalize(p.strip())
+                        if normalized and is_valid(normalized):
+                            all_participants.add(normalized)
                 continue
             
-            # participants 필드가 없으면 transcript 파싱
+            # 그 외(없음/빈 배열/배열이 아닌 값)는 transcript 파싱
             transcript = meeting.get('transcript', '')
             if transcript:
                 try:
                     parsed = analyzer.parse_transcript(transcript)
-                    for entry in parsed:
-                        speaker = entry.get('speaker', '').strip()
-                        if speaker and analyzer._is_valid_participant(speaker):
-                            normalized = analyzer._normalize_participant_name(speaker)
+                    for speaker in _unique_speakers(parsed):
+                        if is_valid(speaker):
+                            normalized = normalize(speaker)
                             if normalized:
                                 all_participants.add(normalized)
                 except:
@@ -146,19 +405,135 @@ def get_all_participants(analyzer):
     return sorted(list(all_participants))
 
 
-def test_all_transcripts(analyzer, output_dir=None):
+def to_columns(records, fields, defaults=None):
+    """
+    레코드(dict) 리스트를 필드별 리스트(열 형식)로 변환
+    
+    parsed_meetings 등 반환값은 기존 호출부와 저장 형식을 위해 레코드 리스트로 유지하고,
+    표 형태로 후처리(DataFrame/parquet 등)할 때 이 함수로 열 형식을 만들어 사용
+    
+    Args:
+        records: dict 리스트 (예: parsed_meetings)
+        fields: 추출할 필드 이름들
+        defaults: 필드가 없을 때 사용할 기본값 {필드: 값} (없으면 None)
+        
+    Returns:
+        {필드: [값, ...]} 딕셔너리 (각 리스트는 records와 같은 순서)
+    """
+    defaults = defaults or {}
+    return {
+        field: [record.get(field, defaults.get(field)) for record in records]
+        for field in fields
+    }
+
+
+def _classify_failure(transcript):
+    """
+    발언이 추출되지 않은 transcript의 실패 이유 분석
+    
+    Args:
+        transcript: 원본 transcript 텍스트
+        
+    Returns:
+        실패 이유 문자열
+    """
+    if _ENDED_RE.search(transcript):
+        return "Transcription ended 메시지만 있음 (실제 내용 없음)"
+    if '후 스크립트 작성이 종료되었습니다' in transcript:
+        return "후 스크립트 작성 종료 메시지만 있음 (실제 내용 없음)"
+    if len(transcript.strip()) < 200:
+        return f"Transcript가 너무 짧음 ({len(transcript)}자)"
+    if not any(char in transcript for char in (':', '[', ']')):
+        return "타임스탬프/발언자 구분자 없음"
+    return "발언이 추출되지 않았습니다"
+
+
+def _summarize_counts(counts):
+    """
+    회의별 개수 배열의 최소/최대/평균 계산
+    
+    array('i')에 대해 내장 min/max/sum은 각각 C 수준에서 한 번씩 순회하므로
+    Python 루프로 한 번에 합치는 것보다 빠름
+    
+    Args:
+        counts: 비어 있지 않은 정수 시퀀스 (array('i') 등)
+        
+    Returns:
+        (최소, 최대, 평균) 튜플
+    """
+    return min(counts), max(counts), sum(counts) / len(counts)
+
+
+def _quiet(*args, **kwargs):
+    """verbose=False일 때 회의별 출력을 대신하는 빈 함수"""
+
+
+def _str_len_expr(field):
+    """문자열 필드의 길이(코드 포인트) 식 (문자열이 아니거나 없으면 0)"""
+    return {
+        '$cond': [
+            {'$eq': [{'$type': field}, 'string']},
+            {'$strLenCP': field},
+            0
+        ]
+    }
+
+
+def _with_length_prefilter(filters, post_filters):
+    """
+    transcript 길이 post 필터 중 서버에서 안전하게 판단할 수 있는 부분을 쿼리에 추가
+    
+    파싱 후 길이 검사는 정규화된 transcript 기준이라(Google Drive 문서는 content에서
+    Transcript 섹션만 추출) 서버 조건은 확실히 제외되는 문서만 거르고,
+    정확한 검사는 기존처럼 파싱 후 Python에서 수행함.
+    - 최소 길이: transcript와 content 중 긴 쪽도 최소 길이 미만이면 제외
+    - 최대 길이: transcript 필드 자체가 최대 길이를 넘으면 제외 (비어 있지 않으면 그대로 사용되므로)
+    
+    Args:
+        filters: MongoDB 쿼리 필터 딕셔너리 (변경하지 않음)
+        post_filters: 파싱 후 필터링 조건 (None 가능)
+        
+    Returns:
+        길이 조건이 추가된 새 필터 (추가할 조건이 없으면 filters 그대로)
+    """
+    if not post_filters:
+        return filters
+    
+    conditions = []
+    if post_filters.get('min_transcript_length'):
+        conditions.append({'$gte': [
+            {'$max': [_str_len_expr('$transcript'), _str_len_expr('$content')]},
+            post_filters['min_transcript_length']
+        ]})
+    if post_filters.get('max_transcript_length'):
+        conditions.append({'$lte': [
+            _str_len_expr('$transcript'),
+            post_filters['max_transcript_length']
+        ]})
+    if not conditions:
+        return filters
+    
+    query = dict(filters or {})
+    if '$expr' in query:
+        conditions.insert(0, query['$expr'])
+    query['$expr'] = conditions[0] if len(conditions) == 1 else {'$and': conditions}
+    return query
+
+
+def test_all_transcripts(analyzer, output_dir=None, verbose=False):
     """
     MongoDB에서 모든 transcript를 가져와 파싱 테스트
     
     Args:
         analyzer: MeetingPerformanceAnalyzer 인스턴스
         output_dir: 출력 파일을 저장할 디렉토리 (None이면 현재 스크립트 디렉토리)
+        verbose: True이면 회의별 파싱 결과를 모두 출력 (False이면 진행 상황과 요약만 출력)
         
     Returns:
         dict: {
             'parsed_meetings': [...],
             'failed_meetings': [...],
-            'meetings': [...],  # 원본 회의 데이터
+            'meetings': [...],  # 회의 데이터 (MEETING_ANALYSIS_PROJECTION 필드만)
             'summary': {...}
         }
     """
@@ -168,7 +543,9 @@ def test_all_transcripts(analyzer, output_dir=None):
     
     # 모든 transcript 가져오기
     print(f"\n📚 MongoDB에서 transcript 가져오는 중...")
-    meetings = analyzer.fetch_meeting_records()
+    meetings = analyzer.fetch_meeting_records(
+        projection=MEETING_ANALYSIS_PROJECTION, batch_size=TRANSCRIPT_BATCH_SIZE
+    )
     
     if not meetings:
         print("⚠️  가져온 transcript가 없습니다.")
@@ -187,63 +564,63 @@ def test_all_transcripts(analyzer, output_dir=None):
     print("📝 파싱 테스트 시작")
     print("="*80)
     
+    # transcript가 있는 회의를 먼저 한꺼번에 파싱 (CPU 작업이므로 프로세스 풀로 병렬 처리)
+    parse_results = _parse_meetings(analyzer, meetings)
+    
     # 통계 변수
     total_meetings = len(meetings)
+    say = print if verbose else _quiet
     success_count = 0
     fail_count = 0
     total_statements = 0
     total_participants = set()
-    participant_count_by_meeting = []
+    participant_count_by_meeting = array('i')  # 회의별 참여자 수 (연속된 int 버퍼)
     failed_meetings = []
     parsed_meetings = []
     
     # 각 transcript 파싱 테스트
     for idx, meeting in enumerate(meetings, 1):
-        meeting_id = str(meeting.get('_id', ''))
-        meeting_title = meeting.get('title', 'N/A')
-        meeting_date = meeting.get('date', 'N/A')
+        # verbose가 아니면 회의별 상세 대신 PROGRESS_EVERY개마다 진행 상황만 출력
+        if not verbose and (idx % PROGRESS_EVERY == 0 or idx == total_meetings):
+            print(f"   ... {idx}/{total_meetings}개 처리")
         
-        print(f"\n[{idx}/{total_meetings}] {meeting_title}")
-        print(f"   ID: {meeting_id[:24]}...")
-        print(f"   날짜: {meeting_date}")
+        # parsed_meetings에는 원본 _id(ObjectId)를 그대로 보관 (실패 기록은 JSON 저장용 문자열)
+        meeting_id, meeting_title, meeting_date, transcript = (
+            meeting.get('_id', ''), meeting.get('title', 'N/A'),
+            meeting.get('date', 'N/A'), meeting.get('transcript', '')
+        )
         
-        # Transcript 가져오기
-        transcript = meeting.get('transcript', '')
+        say(f"\n[{idx}/{total_meetings}] {meeting_title}")
+        say(f"   ID: {str(meeting_id)[:24]}...")
+        say(f"   날짜: {meeting_date}")
         
         if not transcript:
-            print("   ⚠️  Transcript가 없습니다.")
+            say("   ⚠️  Transcript가 없습니다.")
             fail_count += 1
             failed_meetings.append({
-                "id": meeting_id,
+                "id": str(meeting_id),
                 "title": meeting_title,
                 "date": str(meeting_date) if meeting_date != 'N/A' else None,
                 "failure_reason": "Transcript가 없습니다"
             })
             continue
         
-        print(f"   📄 Transcript 길이: {len(transcript)} 문자")
+        say(f"   📄 Transcript 길이: {len(transcript)} 문자")
         
         # Transcript 파싱
         try:
-            parsed_transcript = analyzer.parse_transcript(transcript)
+            parse_result = parse_results[idx]
+            if isinstance(parse_result, Exception):
+                raise parse_result
+            parsed_transcript, stats = parse_result
             
             if not parsed_transcript:
-                print("   ❌ 파싱 실패: 발언이 추출되지 않았습니다.")
+                say("   ❌ 파싱 실패: 발언이 추출되지 않았습니다.")
                 fail_count += 1
-                # 실패 이유 분석
-                failure_reason = "발언이 추출되지 않았습니다"
-                transcript_lower = transcript.lower()
-                if 'transcription ended after' in transcript_lower:
-                    failure_reason = "Transcription ended 메시지만 있음 (실제 내용 없음)"
-                elif '후 스크립트 작성이 종료되었습니다' in transcript:
-                    failure_reason = "후 스크립트 작성 종료 메시지만 있음 (실제 내용 없음)"
-                elif len(transcript.strip()) < 200:
-                    failure_reason = f"Transcript가 너무 짧음 ({len(transcript)}자)"
-                elif not any(char in transcript for char in [':', '[', ']']):
-                    failure_reason = "타임스탬프/발언자 구분자 없음"
+                failure_reason = _classify_failure(transcript)
                 
                 failed_meetings.append({
-                    "id": meeting_id,
+                    "id": str(meeting_id),
                     "title": meeting_title,
                     "date": str(meeting_date) if meeting_date != 'N/A' else None,
                     "failure_reason": failure_reason,
@@ -251,9 +628,9 @@ def test_all_transcripts(analyzer, output_dir=None):
                 })
                 continue
             
-            # 통계 추출
-            stats = analyzer.extract_participant_stats(parsed_transcript)
-            participants = list(stats.keys())
+            # 통계 (parse_and_stats에서 계산됨)
+            # 발언자 이름은 회의마다 반복되므로 intern해서 같은 문자열 객체를 공유
+            participants = [sys.intern(p) for p in stats]
             
             # 통계 업데이트
             success_count += 1
@@ -276,19 +653,20 @@ def test_all_transcripts(analyzer, output_dir=None):
             })
             
             # 결과 출력
-            print(f"   ✅ 파싱 성공!")
-            print(f"      - 발언 수: {len(parsed_transcript)}개")
-            print(f"      - 참여자: {len(participants)}명 ({', '.join(participants)})")
+            say(f"   ✅ 파싱 성공!")
+            say(f"      - 발언 수: {len(parsed_transcript)}개")
+            say(f"      - 참여자: {len(participants)}명 ({', '.join(participants)})")
             
             # 참여자별 통계 (간단히)
-            for speaker, stat in stats.items():
-                print(f"         • {speaker}: {stat['speak_count']}회 발언, {stat['total_words']}단어")
+            if verbose:
+                for speaker, stat in stats.items():
+                    say(f"         • {speaker}: {stat['speak_count']}회 발언, {stat['total_words']}단어")
             
         except Exception as e:
-            print(f"   ❌ 파싱 오류: {str(e)}")
+            say(f"   ❌ 파싱 오류: {str(e)}")
             fail_count += 1
             failed_meetings.append({
-                "id": meeting_id,
+                "id": str(meeting_id),
                 "title": meeting_title,
                 "date": str(meeting_date) if meeting_date != 'N/A' else None,
                 "failure_reason": f"파싱 오류: {str(e)}",
@@ -301,12 +679,11 @@ def test_all_transcripts(analyzer, output_dir=None):
         if output_dir is None:
             output_dir = os.path.dirname(os.path.abspath(__file__))
         output_file = os.path.join(output_dir, "parsing_failed.json")
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump({
-                "total_failed": len(failed_meetings),
-                "generated_at": datetime.now().isoformat(),
-                "failed_meetings": failed_meetings
-            }, f, ensure_ascii=False, indent=2)
+        write_json(output_file, {
+            "total_failed": len(failed_meetings),
+            "generated_at": datetime.now().isoformat(),
+            "failed_meetings": failed_meetings
+        })
         print(f"\n💾 실패한 회의 정보를 '{output_file}' 파일에 저장했습니다.")
         print(f"   총 {len(failed_meetings)}개의 실패 케이스가 기록되었습니다.")
     
@@ -326,10 +703,10 @@ def test_all_transcripts(analyzer, output_dir=None):
         print(f"   - 평균 발언 수/회의: {total_statements/success_count:.1f}개")
         print(f"   - 고유 참여자 수: {len(total_participants)}명")
         if participant_count_by_meeting:
-            avg_participants = sum(participant_count_by_meeting) / len(participant_count_by_meeting)
+            min_participants, max_participants, avg_participants = _summarize_counts(participant_count_by_meeting)
             print(f"   - 평균 참여자 수/회의: {avg_participants:.1f}명")
-            print(f"   - 최소 참여자 수: {min(participant_count_by_meeting)}명")
-            print(f"   - 최대 참여자 수: {max(participant_count_by_meeting)}명")
+            print(f"   - 최소 참여자 수: {min_participants}명")
+            print(f"   - 최대 참여자 수: {max_participants}명")
         
         print(f"\n👥 전체 참여자 목록 ({len(total_participants)}명):")
         for i, participant in enumerate(sorted(total_participants), 1):
@@ -350,7 +727,7 @@ def test_all_transcripts(analyzer, output_dir=None):
     }
 
 
-def test_with_filters(analyzer, filters, post_filters=None, output_dir=None):
+def test_with_filters(analyzer, filters, post_filters=None, output_dir=None, verbose=False):
     """
     필터를 사용하여 특정 조건의 transcript만 테스트
     
@@ -359,12 +736,13 @@ def test_with_filters(analyzer, filters, post_filters=None, output_dir=None):
         filters: MongoDB 쿼리 필터 딕셔너리
         post_filters: 파싱 후 필터링할 조건들 (선택사항)
         output_dir: 출력 파일을 저장할 디렉토리 (None이면 현재 스크립트 디렉토리)
+        verbose: True이면 회의별 파싱 결과를 모두 출력 (False이면 진행 상황과 요약만 출력)
         
     Returns:
         dict: {
             'parsed_meetings': [...],
             'failed_meetings': [...],
-            'meetings': [...],  # 원본 회의 데이터
+            'meetings': [...],  # 회의 데이터 (MEETING_ANALYSIS_PROJECTION 필드만)
             'filters': {...},  # 적용된 필터
             'post_filters': {...},  # 적용된 post 필터
             'summary': {...}
@@ -392,8 +770,12 @@ def test_with_filters(analyzer, filters, post_filters=None, output_dir=None):
         print("\n🔍 필터 없음: 모든 회의를 분석합니다.")
     
     # 필터링된 transcript 가져오기
+    # (길이 조건으로 확실히 제외되는 문서는 서버에서 걸러 전송하지 않음)
     print(f"\n📚 MongoDB에서 transcript 가져오는 중...")
-    meetings = analyzer.fetch_meeting_records(filters)
+    meetings = analyzer.fetch_meeting_records(
+        _with_length_prefilter(filters, post_filters),
+        projection=MEETING_ANALYSIS_PROJECTION, batch_size=TRANSCRIPT_BATCH_SIZE
+    )
     
     if not meetings:
         print("⚠️  필터 조건에 맞는 transcript가 없습니다.")
@@ -413,8 +795,12 @@ def test_with_filters(analyzer, filters, post_filters=None, output_dir=None):
     print("📝 파싱 테스트 시작")
     print("="*80)
     
+    # transcript가 있는 회의를 먼저 한꺼번에 파싱 (CPU 작업이므로 프로세스 풀로 병렬 처리)
+    parse_results = _parse_meetings(analyzer, meetings)
+    
     # 통계 변수
     total_meetings = len(meetings)
+    say = print if verbose else _quiet
     success_count = 0
     fail_count = 0
     total_statements = 0
@@ -424,21 +810,24 @@ def test_with_filters(analyzer, filters, post_filters=None, output_dir=None):
     parsed_meetings = []
     
     for idx, meeting in enumerate(meetings, 1):
-        meeting_id = str(meeting.get('_id', ''))
-        meeting_title = meeting.get('title', 'N/A')
-        meeting_date = meeting.get('date', 'N/A')
+        # verbose가 아니면 회의별 상세 대신 PROGRESS_EVERY개마다 진행 상황만 출력
+        if not verbose and (idx % PROGRESS_EVERY == 0 or idx == total_meetings):
+            print(f"   ... {idx}/{total_meetings}개 처리")
         
-        print(f"\n[{idx}/{total_meetings}] {meeting_title}")
-        print(f"   날짜: {meeting_date}")
+        # parsed_meetings에는 원본 _id(ObjectId)를 그대로 보관 (실패 기록은 JSON 저장용 문자열)
+        meeting_id, meeting_title, meeting_date, transcript = (
+            meeting.get('_id', ''), meeting.get('title', 'N/A'),
+            meeting.get('date', 'N/A'), meeting.get('transcript', '')
+        )
         
-        # Transcript 가져오기
-        transcript = meeting.get('transcript', '')
+        say(f"\n[{idx}/{total_meetings}] {meeting_title}")
+        say(f"   날짜: {meeting_date}")
         
         if not transcript:
-            print("   ⚠️  Transcript가 없습니다.")
+            say("   ⚠️  Transcript가 없습니다.")
             fail_count += 1
             failed_meetings.append({
-                "id": meeting_id,
+                "id": str(meeting_id),
                 "title": meeting_title,
                 "date": str(meeting_date) if meeting_date != 'N/A' else None,
                 "failure_reason": "Transcript가 없습니다"
@@ -447,25 +836,18 @@ def test_with_filters(analyzer, filters, post_filters=None, output_dir=None):
         
         # Transcript 파싱
         try:
-            parsed_transcript = analyzer.parse_transcript(transcript)
+            parse_result = parse_results[idx]
+            if isinstance(parse_result, Exception):
+                raise parse_result
+            parsed_transcript, stats = parse_result
             
             if not parsed_transcript:
-                print("   ❌ 파싱 실패: 발언이 추출되지 않았습니다.")
+                say("   ❌ 파싱 실패: 발언이 추출되지 않았습니다.")
                 fail_count += 1
-                # 실패 이유 분석
-                failure_reason = "발언이 추출되지 않았습니다"
-                transcript_lower = transcript.lower()
-                if 'transcription ended after' in transcript_lower:
-                    failure_reason = "Transcription ended 메시지만 있음 (실제 내용 없음)"
-                elif '후 스크립트 작성이 종료되었습니다' in transcript:
-                    failure_reason = "후 스크립트 작성 종료 메시지만 있음 (실제 내용 없음)"
-                elif len(transcript.strip()) < 200:
-                    failure_reason = f"Transcript가 너무 짧음 ({len(transcript)}자)"
-                elif not any(char in transcript for char in [':', '[', ']']):
-                    failure_reason = "타임스탬프/발언자 구분자 없음"
+                failure_reason = _classify_failure(transcript)
                 
                 failed_meetings.append({
-                    "id": meeting_id,
+                    "id": str(meeting_id),
                     "title": meeting_title,
                     "date": str(meeting_date) if meeting_date != 'N/A' else None,
                     "failure_reason": failure_reason,
@@ -473,9 +855,9 @@ def test_with_filters(analyzer, filters, post_filters=None, output_dir=None):
                 })
                 continue
             
-            # 통계 추출
-            stats = analyzer.extract_participant_stats(parsed_transcript)
-            participants = list(stats.keys())
+            # 통계 (parse_and_stats에서 계산됨)
+            # 발언자 이름은 회의마다 반복되므로 intern해서 같은 문자열 객체를 공유
+            participants = [sys.intern(p) for p in stats]
             
             # 파싱 후 필터링 적용
             should_include = True
@@ -484,33 +866,35 @@ def test_with_filters(analyzer, filters, post_filters=None, output_dir=None):
             if 'min_transcript_length' in post_filters:
                 min_len = post_filters['min_transcript_length']
                 if len(transcript) < min_len:
-                    print(f"   ⏭️  필터링됨: Transcript 길이가 {min_len}자 미만입니다 ({len(transcript)}자).")
+                    say(f"   ⏭️  필터링됨: Transcript 길이가 {min_len}자 미만입니다 ({len(transcript)}자).")
                     should_include = False
             
             if should_include and 'max_transcript_length' in post_filters:
                 max_len = post_filters['max_transcript_length']
                 if len(transcript) > max_len:
-                    print(f"   ⏭️  필터링됨: Transcript 길이가 {max_len}자 초과입니다 ({len(transcript)}자).")
+                    say(f"   ⏭️  필터링됨: Transcript 길이가 {max_len}자 초과입니다 ({len(transcript)}자).")
                     should_include = False
             
-            # 참여자 필터 (특정 참여자 포함)
+            # 참여자 필터 (정규화된 발언자 이름과 정확히 일치, 여러 명이면 한 명이라도 포함)
             if should_include and 'participants' in post_filters:
-                required_participant = post_filters['participants']
-                if required_participant not in participants:
-                    print(f"   ⏭️  필터링됨: '{required_participant}' 참여자가 없습니다.")
+                required_participants = post_filters['participants']
+                if isinstance(required_participants, str):
+                    required_participants = [required_participants]
+                if not any(name in participants for name in required_participants):
+                    say(f"   ⏭️  필터링됨: {', '.join(repr(name) for name in required_participants)} 참여자가 없습니다.")
                     should_include = False
             
             # 참여자 수 필터
             if should_include and 'min_participants' in post_filters:
                 min_p = post_filters['min_participants']
                 if len(participants) < min_p:
-                    print(f"   ⏭️  필터링됨: 참여자 수가 {min_p}명 미만입니다 ({len(participants)}명).")
+                    say(f"   ⏭️  필터링됨: 참여자 수가 {min_p}명 미만입니다 ({len(participants)}명).")
                     should_include = False
             
             if should_include and 'max_participants' in post_filters and post_filters['max_participants']:
                 max_p = post_filters['max_participants']
                 if len(participants) > max_p:
-                    print(f"   ⏭️  필터링됨: 참여자 수가 {max_p}명 초과입니다 ({len(participants)}명).")
+                    say(f"   ⏭️  필터링됨: 참여자 수가 {max_p}명 초과입니다 ({len(participants)}명).")
                     should_include = False
             
             if not should_include:
@@ -538,13 +922,13 @@ def test_with_filters(analyzer, filters, post_filters=None, output_dir=None):
             })
             
             # 결과 출력
-            print(f"   ✅ 파싱 성공: {len(parsed_transcript)}개 발언, {len(participants)}명 참여자")
+            say(f"   ✅ 파싱 성공: {len(parsed_transcript)}개 발언, {len(participants)}명 참여자")
             
         except Exception as e:
-            print(f"   ❌ 파싱 오류: {str(e)}")
+            say(f"   ❌ 파싱 오류: {str(e)}")
             fail_count += 1
             failed_meetings.append({
-                "id": meeting_id,
+                "id": str(meeting_id),
                 "title": meeting_title,
                 "date": str(meeting_date) if meeting_date != 'N/A' else None,
                 "failure_reason": f"파싱 오류: {str(e)}",
@@ -557,12 +941,11 @@ def test_with_filters(analyzer, filters, post_filters=None, output_dir=None):
         if output_dir is None:
             output_dir = os.path.dirname(os.path.abspath(__file__))
         output_file = os.path.join(output_dir, "parsing_failed.json")
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump({
-                "total_failed": len(failed_meetings),
-                "generated_at": datetime.now().isoformat(),
-                "failed_meetings": failed_meetings
-            }, f, ensure_ascii=False, indent=2)
+        write_json(output_file, {
+            "total_failed": len(failed_meetings),
+            "generated_at": datetime.now().isoformat(),
+            "failed_meetings": failed_meetings
+        })
         print(f"\n💾 실패한 회의 정보를 '{output_file}' 파일에 저장했습니다.")
         print(f"   총 {len(failed_meetings)}개의 실패 케이스가 기록되었습니다.")
     